@@ -209,11 +209,11 @@ class ScraperEngine:
         Returns:
             Number of matches processed
         """
-        start_time = time.time()
+        start_time = time.monotonic()
 
         try:
             matches = await scraper.scrape_all()
-            scrape_time = time.time() - start_time
+            scrape_time = time.monotonic() - start_time
             logger.info(f"[{scraper.bookmaker_name}] Scraped {len(matches)} matches in {scrape_time:.2f}s, processing...")
 
             # Convert ScrapedMatch objects to dicts for bulk processing
@@ -253,7 +253,7 @@ class ScraperEngine:
                 matches_data, scraper.bookmaker_id
             )
 
-            total_time = time.time() - start_time
+            total_time = time.monotonic() - start_time
             self._stats['matches_processed'] += processed
             logger.info(f"[{scraper.bookmaker_name}] Processed {processed} matches in {total_time:.2f}s (scrape: {scrape_time:.2f}s, db: {total_time - scrape_time:.2f}s)")
             return len(matches)
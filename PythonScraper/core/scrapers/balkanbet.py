@@ -12,8 +12,13 @@ Supports: Football (18), Basketball (36), Tennis (78), Hockey (21).
 import asyncio
 import logging
 import re
+import sys
+import time
 from datetime import datetime, timezone
-from typing import Optional, List, Dict, Any, Tuple
+from functools import lru_cache, wraps
+from typing import Optional, List, Dict, Any, Tuple, Callable
+
+import aiohttp
 
 from .base import BaseScraper, ScrapedMatch, ScrapedOdds
 
@@ -38,6 +43,31 @@ INTERNAL_TO_BB = {v: k for k, v in SPORT_MAPPING.items()}
 # Concurrency limit for detail requests
 MAX_CONCURRENT_DETAIL = 15
 
+# Overview 'filter[from]' is floored to this many seconds so a sport's
+# requests in the same window share a URL
+OVERVIEW_FROM_BUCKET = 30
+
+# Constant query parameters for the NSoft endpoints, built once as pair tuples;
+# callers append only the per-request values (sport/from, event id)
+_LANGUAGE_PARAM = '{"default":"sr-Latn","events":"sr-Latn","sport":"sr-Latn","category":"sr-Latn","tournament":"sr-Latn","team":"sr-Latn","market":"sr-Latn"}'
+_OVERVIEW_BASE_QUERY = (
+    ('deliveryPlatformId', '3'),
+    ('dataFormat', '{"default":"object","events":"array","outcomes":"array"}'),
+    ('language', _LANGUAGE_PARAM),
+    ('timezone', 'Europe/Budapest'),
+    ('company', '{}'),
+    ('companyUuid', COMPANY_UUID),
+    ('sort', 'categoryPosition,categoryName,tournamentPosition,tournamentName,startsAt'),
+    ('offerTemplate', 'WEB_OVERVIEW'),
+    ('shortProps', '1'),
+)
+_DETAIL_BASE_QUERY = (
+    ('companyUuid', COMPANY_UUID),
+    ('language', _LANGUAGE_PARAM),
+    ('timezone', 'Europe/Budapest'),
+    ('dataFormat', '{"default":"array","markets":"array","events":"array"}'),
+)
+
 # ============================================================================
 # MARKET MAPPING: BalkanBet marketId → (internal_bet_type_id, parser_type)
 #
@@ -250,14 +280,141 @@ SPORT_MAPS = {
     4: HOCKEY_MAP,
 }
 
+# Flat (sport_id, marketId) → (bt, parser_type) lookup built once at import.
+# Unmapped and 'skip' entries are dropped so the hot path needs a single probe.
+MARKET_LOOKUP: Dict[Tuple[int, int], Tuple[int, str]] = {
+    (sport_id, market_id): (bt, sys.intern(parser_type))
+    for sport_id, market_map in SPORT_MAPS.items()
+    for market_id, (bt, parser_type) in market_map.items()
+    if bt is not None and parser_type != 'skip'
+}
+
+# marketIds with a parser, per sport; all other markets are skipped unread
+PARSED_MARKET_IDS: Dict[int, frozenset] = {
+    sport_id: frozenset(mid for (sid, mid) in MARKET_LOOKUP if sid == sport_id)
+    for sport_id in SPORT_MAPS
+}
+
 # ============================================================================
 # SELECTION NORMALIZATION
+#
+# Top-level normalizers are pure functions of (name, bt, market_id) and the
+# same outcome names repeat across every match, so they are memoized. Short
+# results are interned so every match shares one string per selection.
 # ============================================================================
 
 # Bet types where standalone single digits → T-prefix (exact goal count)
 _GOAL_EXACT_BTS = frozenset({25, 26, 27, 28, 29, 30, 31, 32, 33, 34})
 
+# Team/half prefixes stripped from goal range outcomes ("DII 1+", "GI 2+", "I 1+")
+_GOAL_PREFIXES = ('DII ', 'DI ', 'GII ', 'GI ', 'II ', 'I ')
+
+# Half BTTS tokens (with and without the space BalkanBet sometimes omits)
+_HALF_BTTS = {
+    'IGG': 'GG_H1', 'I GG': 'GG_H1',
+    'IIGG': 'GG_H2', 'II GG': 'GG_H2',
+    'ING': 'NG_H1', 'I NG': 'NG_H1',
+    'IING': 'NG_H2', 'II NG': 'NG_H2',
+}
+
+# Constant BTTS outcomes/parts: half BTTS plus plain GG/NG and negations
+_BTTS_CONST = {
+    **_HALF_BTTS,
+    'GG': 'GG', 'NG': 'NG',
+    'NE I GG': '!GG_H1', 'NE II GG': '!GG_H2',
+}
+
+# Standalone lowercase "v" (OR separator) not embedded in a word
+_STANDALONE_V_RE = re.compile(r'(?<!\w)v(?!\w)')
+
+# OR separator "v" with optional surrounding whitespace ("IGGvII GG", "1 v 3+")
+_OR_SPLIT_RE = re.compile(r'\s*v\s*', re.IGNORECASE)
+
+# Exact goal count with optional team/half prefix: "1 gol", "DI 2 gol.", "G2g."
+_EXACT_GOAL_RE = re.compile(r'^(?:DII\s+|DI\s+|GII\s+|GI\s+|II\s+|I\s+|D|G)?(\d)\s*(?:gol|g)\.?$')
+
+# Negated group: "NE(I1+&II1+)"
+_NE_GROUP_RE = re.compile(r'^NE\((.+)\)$')
 
+# HT/FT pair inside an OR part: "1-1" → "1/1"
+_HTFT_DASH_RE = re.compile(r'([12X])-([12X])')
+
+# O/U words as BalkanBet spells them; anything else takes the substring scan
+# (shared by the O/U combo normalizer and the plain O/U market parser)
+_OU_WORD = {
+    'Manje': 'U', 'manje': 'U', 'MANJE': 'U',
+    'Više': 'O', 'više': 'O', 'VIŠE': 'O',
+    'Vise': 'O', 'vise': 'O', 'VISE': 'O',
+}
+
+# 2-way BTTS outcome names → yes (GG) / no (NG); others take the substring scan
+_BTTS_YES_NO = {
+    'GG': True, 'GG Da': True, 'Da': True,
+    'NG': False, 'GG Ne': False, 'Ne': False,
+}
+
+# Correct score at the start of an outcome name: "2:1"
+_CORRECT_SCORE_RE = re.compile(r'(\d+):(\d+)')
+
+# Deletion table for grouping parentheses in combo selections
+_DROP_PARENS = str.maketrans('', '', '()')
+
+# Combo/OR part grammar, tried in order as a single alternation. Each branch
+# has exactly one named group: its name (match.lastgroup) picks the rewrite in
+# _PART_REWRITES and its text is the payload passed to it.
+_PART_GRAMMAR = (
+    # Half comparison: "I >" → "H1>H2", "II >" → "H1<H2", "I = II" → "H1=H2"
+    r'(?P<h1_more>I ?>)$',
+    r'(?P<h2_more>II ?>)$',
+    r'(?P<halves_equal>I = II|I=II)$',
+    # Half result / DC: "I 1" → "1_H1", "I 1X" → "1X_H1", "II X" → "X_H2"
+    r'I\s+(?P<h1_result>1X|X2|12|[1X2])$',
+    r'II\s+(?P<h2_result>[1X2])$',
+    # Team+half goals: "DI1+" → "H1:1+", "GII2+" → "H2:2+"
+    # (team is already encoded in bt119 vs bt120, so strip team prefix)
+    r'[DG]II(?P<team_h2_goals>\d[\d\-+]*)$',
+    r'[DG]I(?P<team_h1_goals>\d[\d\-+]*)$',
+    # Half goals/ranges: "I1+" → "H1:1+", "II0-2" → "H2:0-2"
+    r'II(?P<h2_goals>\d[\d\-+]*)$',
+    r'I(?P<h1_goals>\d[\d\-+]*)$',
+    # Team totals: "D2+" → "H2+", "G2+" → "A2+" (bare "2+" for bt119/bt120)
+    r'D(?P<home_goals>\d[\d\-+]*)$',
+    r'G(?P<away_goals>\d[\d\-+]*)$',
+)
+_PART_RE = re.compile('|'.join(_PART_GRAMMAR))
+
+_PART_REWRITES = {
+    'h1_more': lambda v, bt: 'H1>H2',
+    'h2_more': lambda v, bt: 'H1<H2',
+    'halves_equal': lambda v, bt: 'H1=H2',
+    'h1_result': lambda v, bt: v + '_H1',
+    'h2_result': lambda v, bt: v + '_H2',
+    'team_h2_goals': lambda v, bt: 'H2:' + v,
+    'team_h1_goals': lambda v, bt: 'H1:' + v,
+    'h2_goals': lambda v, bt: 'H2:' + v,
+    'h1_goals': lambda v, bt: 'H1:' + v,
+    'home_goals': lambda v, bt: v if bt in (119, 120) else 'H' + v,
+    'away_goals': lambda v, bt: v if bt in (119, 120) else 'A' + v,
+}
+
+
+# Longest result worth interning; longer combo strings are rare one-offs
+_INTERN_MAX_LEN = 16
+
+
+def _interned(fn):
+    """Intern short normalizer results so repeated selections share one object."""
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        r = fn(*args, **kwargs)
+        if r is not None and len(r) < _INTERN_MAX_LEN:
+            return sys.intern(r)
+        return r
+    return wrapper
+
+
+@lru_cache(maxsize=8192)
+@_interned
 def _normalize_selection(name: str, bt: int, market_id: int) -> str:
     """Normalize BalkanBet outcome name to cross-bookmaker standard selection format.
 
@@ -283,13 +440,14 @@ def _normalize_selection(name: str, bt: int, market_id: int) -> str:
 
     # === Exact goal markets: standalone digit → T-prefix ===
     if bt in _GOAL_EXACT_BTS:
-        m = re.match(r'^(\d)$', name)
-        if m:
-            return 'T' + m.group(1)
+        if len(name) == 1 and name.isdigit():
+            return 'T' + name
 
     return name
 
 
+@lru_cache(maxsize=8192)
+@_interned
 def _normalize_btts_outcome(name: str) -> str:
     """Normalize BTTS market outcome names.
 
@@ -307,81 +465,42 @@ def _normalize_btts_outcome(name: str) -> str:
     """
     n = name.strip()
 
-    # Simple BTTS
-    if n == 'GG':
-        return 'GG'
-    if n == 'NG':
-        return 'NG'
-
-    # Half BTTS
-    if n == 'I GG':
-        return 'GG_H1'
-    if n == 'II GG':
-        return 'GG_H2'
-    if n == 'I NG':
-        return 'NG_H1'
-    if n == 'II NG':
-        return 'NG_H2'
-
-    # Negation
-    if n == 'NE I GG':
-        return '!GG_H1'
-    if n == 'NE II GG':
-        return '!GG_H2'
+    # Simple, half and negated BTTS
+    r = _BTTS_CONST.get(n)
+    if r is not None:
+        return r
 
     # Combo with & separator
     if '&' in n:
-        parts = n.split('&')
-        normalized_parts = []
-        for p in parts:
-            p = p.strip()
-            np = _normalize_btts_part(p)
-            normalized_parts.append(np)
-        return '&'.join(normalized_parts)
+        return '&'.join([_normalize_btts_part(p.strip()) for p in n.split('&')])
 
     # OR separator: "v" (without surrounding spaces sometimes)
-    if 'v' in n.lower():
+    if 'v' in n or 'V' in n:
         # "IGGvII GG" or "GG v3+"
-        parts = re.split(r'\s*v\s*', n, flags=re.IGNORECASE)
-        normalized_parts = []
-        for p in parts:
-            p = p.strip()
-            np = _normalize_btts_part(p)
-            normalized_parts.append(np)
-        return '|'.join(normalized_parts)
+        return '|'.join([_normalize_btts_part(p.strip()) for p in _OR_SPLIT_RE.split(n)])
 
     return _normalize_btts_part(n)
 
 
 def _normalize_btts_part(p: str) -> str:
-    """Normalize a single part of a BTTS combo outcome."""
-    p = p.strip()
-
-    # Half BTTS
-    if p in ('IGG', 'I GG'):
-        return 'GG_H1'
-    if p in ('IIGG', 'II GG'):
-        return 'GG_H2'
-    if p in ('I NG', 'ING'):
-        return 'NG_H1'
-    if p in ('II NG', 'IING'):
-        return 'NG_H2'
-    if p == 'GG':
-        return 'GG'
-    if p == 'NG':
-        return 'NG'
-    if p == 'NE I GG':
-        return '!GG_H1'
-    if p == 'NE II GG':
-        return '!GG_H2'
-
-    # Team references: D → H (home), G → A (away)
-    p = re.sub(r'^D(\d)', r'H\1', p)
-    p = re.sub(r'^G(\d)', r'A\1', p)
-
-    # Half goal references: I → H1:, II → H2:
-    p = re.sub(r'^I(\d)', r'H1:\1', p)
-    p = re.sub(r'^II(\d)', r'H2:\1', p)
+    """Normalize a single (already stripped) part of a BTTS combo outcome."""
+    # Simple, half and negated BTTS
+    r = _BTTS_CONST.get(p)
+    if r is not None:
+        return r
+
+    if len(p) >= 2 and p[1].isdigit():
+        # Team references: D → H (home), G → A (away)
+        # Half goal references: I → H1:
+        if p[0] == 'D':
+            p = 'H' + p[1:]
+        elif p[0] == 'G':
+            p = 'A' + p[1:]
+        elif p[0] == 'I':
+            p = 'H1:' + p[1:]
+    elif p.startswith('II') and p[2:3].isdigit():
+        # Half goal references: II → H2:
+        p = 'H2:' + p[2:]
 
     # "D3+ vG3+" → "H3+|A3+"
     if p.startswith('D') and '+' in p:
@@ -392,6 +511,8 @@ def _normalize_btts_part(p: str) -> str:
     return p
 
 
+@lru_cache(maxsize=8192)
+@_interned
 def _normalize_goal_selection(name: str, bt: int) -> str:
     """Normalize goal range/count outcome names.
 
@@ -411,7 +532,7 @@ def _normalize_goal_selection(name: str, bt: int) -> str:
     n = name.strip()
 
     # Exact goal count: "N gol" / "N gol." / "Ng." / "D1g." / "G2g." (abbreviated)
-    m = re.match(r'^(?:DII\s+|DI\s+|GII\s+|GI\s+|II\s+|I\s+|D|G)?(\d)\s*(?:gol|g)\.?$', n)
+    m = _EXACT_GOAL_RE.match(n)
     if m:
         return 'T' + m.group(1)
 
@@ -422,23 +543,19 @@ def _normalize_goal_selection(name: str, bt: int) -> str:
     # For bt30 (h2_total_goals_range): "II 1+" → strip "II "
     # For bt31-34 (team goals per half): "DI 1+", "GII 2+" → strip prefix
 
-    # Remove leading prefix: DII, DI, GII, GI, D, G, II, I (order matters: longest first)
-    for prefix in ['DII ', 'DI ', 'GII ', 'GI ', 'II ', 'I ']:
-        if n.startswith(prefix):
-            n = n[len(prefix):]
-            break
-    else:
-        # Check single-char prefixes without space: D0, G0
-        if bt == 27 and n.startswith('D'):
-            n = n[1:]
-        elif bt == 28 and n.startswith('G'):
-            n = n[1:]
+    # Remove leading prefix: DII, DI, GII, GI, II, I (each ends at the first space)
+    if n[:1] in ('D', 'G', 'I') and n.startswith(_GOAL_PREFIXES):
+        n = n[n.find(' ') + 1:]
+    # Single-char prefixes without space: D0, G0
+    elif bt == 27 and n[:1] == 'D':
+        n = n[1:]
+    elif bt == 28 and n[:1] == 'G':
+        n = n[1:]
 
     # Standalone digit → T-prefix for exact-count BTs
     if bt in _GOAL_EXACT_BTS:
-        m = re.match(r'^(\d)$', n)
-        if m:
-            return 'T' + m.group(1)
+        if len(n) == 1 and n.isdigit():
+            return 'T' + n
 
     # "NE X-Y" → skip (negation markets, not standard)
     if n.startswith('NE '):
@@ -447,6 +564,8 @@ def _normalize_goal_selection(name: str, bt: int) -> str:
     return n
 
 
+@lru_cache(maxsize=8192)
+@_interned
 def _normalize_combo_selection(name: str, bt: int, market_id: int) -> str:
     """Normalize combo market selections (result+goals, DC+goals, etc.).
 
@@ -462,64 +581,75 @@ def _normalize_combo_selection(name: str, bt: int, market_id: int) -> str:
       bt36 (first goal+result): "PDG1 & 1" → "1&H_first"
     """
     n = name.strip()
+    return _COMBO_HANDLERS.get(bt, _combo_generic)(n, bt)
 
-    # HT/FT combo: convert dash→slash in HT/FT portion
-    if bt in (44, 45, 124):
-        # "1-1&2+" → "1/1&2+", "X-1&II2+" → "X/1&II2+"
-        if '&' in n:
-            parts = n.split('&', 1)
-            htft = parts[0].strip().replace('-', '/')
-            rest = _normalize_combo_part(parts[1].strip(), bt)
-            return htft + '&' + rest
-        return n.replace('-', '/')
 
+def _combo_htft(n: str, bt: int) -> str:
+    """HT/FT combos (bt44/45/124): dash → slash in the HT/FT portion.
+
+    "1-1&2+" → "1/1&2+", "X-1&II2+" → "X/1&II2+"
+    """
+    if '&' in n:
+        parts = n.split('&', 1)
+        htft = parts[0].strip().replace('-', '/')
+        rest = _normalize_combo_part(parts[1].strip(), bt)
+        return htft + '&' + rest
+    return n.replace('-', '/')
+
+
+def _combo_generic(n: str, bt: int) -> str:
+    """Default combo handler: '&' parts are joined as-is."""
+    return _combo_parts(n, bt, '&'.join)
+
+
+def _combo_ft_prefixed(n: str, bt: int) -> str:
+    """bt119/bt120: plain number parts get FT: prefix when mixed with H1:/H2:."""
+    return _combo_parts(n, bt, _apply_ft_prefix)
+
+
+def _combo_parts(n: str, bt: int, join_and: Callable[[List[str]], str]) -> str:
+    """Normalize NE(...), OR and '&' combos; join_and builds the '&' result."""
     # NE(...) negation for H1&H2 combos
-    ne_match = re.match(r'^NE\((.+)\)$', n)
+    ne_match = _NE_GROUP_RE.match(n)
     if ne_match:
         inner = ne_match.group(1)
-        inner_norm = _normalize_combo_inner(inner, bt)
-        return '!' + inner_norm
+        if '&' in inner:
+            return '!' + '&'.join(_normalize_combo_part(p.strip(), bt) for p in inner.split('&'))
+        return '!' + _normalize_combo_part(inner.strip(), bt)
 
     # Strip remaining parentheses (grouping only, NE() already handled above)
-    n = n.replace('(', '').replace(')', '')
+    if '(' in n or ')' in n:
+        n = n.translate(_DROP_PARENS)
 
     # OR separator: v → |
-    if ' v ' in n.lower() or re.search(r'(?<!\w)v(?!\w)', n):
-        parts = re.split(r'\s*v\s*', n, flags=re.IGNORECASE)
+    if ' v ' in n or ' V ' in n or _STANDALONE_V_RE.search(n):
+        parts = _OR_SPLIT_RE.split(n)
         return '|'.join(_normalize_combo_part(p.strip(), bt) for p in parts)
 
     # Regular & combo
     if '&' in n:
-        parts = n.split('&')
-        normalized = [_normalize_combo_part(p.strip(), bt) for p in parts]
-        result = '&'.join(normalized)
-
-        # For bt119/bt120: add FT: prefix to plain number parts when mixed with H1:/H2:
-        if bt in (119, 120):
-            result = _apply_ft_prefix(result)
-
-        return result
+        return join_and([_normalize_combo_part(p.strip(), bt) for p in n.split('&')])
 
-    return _normalize_combo_part(n, bt)
+    return _normalize_combo_part(n.strip(), bt)
 
 
-def _apply_ft_prefix(selection: str) -> str:
+def _apply_ft_prefix(parts: List[str]) -> str:
     """Add FT: prefix to plain number parts in bt119/bt120 selections.
 
+    Takes the already-normalized '&' parts and returns the joined selection.
     When a selection mixes H1:/H2: parts with plain numbers (total goals),
     the plain parts get FT: prefix for consistency with other scrapers.
-    Example: "H1:1+&2+" → "H1:1+&FT:2+"
+    Example: ["H1:1+", "2+"] → "H1:1+&FT:2+"
     """
-    parts = selection.split('&')
     has_half = any(p.startswith('H1:') or p.startswith('H2:') for p in parts)
     if not has_half:
-        return selection
+        return '&'.join(parts)
 
     result = []
     for p in parts:
         if p.startswith('H1:') or p.startswith('H2:') or p.startswith('FT:'):
             result.append(p)
-        elif re.match(r'^\d', p):
+        elif p[:1].isdigit():
             # Plain number part like "2+", "0-1" → add FT: prefix
             result.append('FT:' + p)
         else:
@@ -527,92 +657,44 @@ def _apply_ft_prefix(selection: str) -> str:
     return '&'.join(result)
 
 
-def _normalize_combo_inner(inner: str, bt: int) -> str:
-    """Normalize the inner part of a NE(...) expression."""
-    if '&' in inner:
-        parts = inner.split('&')
-        return '&'.join(_normalize_combo_part(p.strip(), bt) for p in parts)
-    return _normalize_combo_part(inner, bt)
+# Per-bt combo handlers; anything not listed uses _combo_generic
+_COMBO_HANDLERS = {
+    44: _combo_htft,
+    45: _combo_htft,
+    124: _combo_htft,
+    119: _combo_ft_prefixed,
+    120: _combo_ft_prefixed,
+}
 
 
 def _normalize_combo_part(p: str, bt: int) -> str:
-    """Normalize a single part of a combo selection."""
-    p = p.strip()
+    """Normalize a single (already stripped) part of a combo selection."""
     if not p:
         return p
 
-    # Half comparison
-    if p in ('I >', 'I>'):
-        return 'H1>H2'
-    if p in ('II >', 'II>'):
-        return 'H1<H2'
-    if p in ('I = II', 'I=II'):
-        return 'H1=H2'
-
-    # Half result references: "I 1" → "1_H1", "II X" → "X_H2"
-    m = re.match(r'^I\s+([1X2])$', p)
-    if m:
-        return m.group(1) + '_H1'
-    m = re.match(r'^II\s+([1X2])$', p)
-    if m:
-        return m.group(1) + '_H2'
-
-    # DC values: "I 1X" → "1X_H1", "I X2" → "X2_H1"
-    m = re.match(r'^I\s+(1X|X2|12)$', p)
-    if m:
-        return m.group(1) + '_H1'
-
-    # First goal references: "PDG1" → "H_first", "PDG2" → "A_first", "PDG Niko" → "none"
+    # First goal: the team is the first character after "PDG" / "PDG ".
+    # This is the only PDG path; any other PDG tail is left as is.
     if p.startswith('PDG'):
-        if '1' in p:
+        tail = p[3:].lstrip()
+        c = tail[:1]
+        if c == '1':
             return 'H_first'
-        elif '2' in p:
+        if c == '2':
             return 'A_first'
-        elif 'Niko' in p:
+        if tail.startswith('Niko'):
             return 'none'
+        return p
 
-    # Team+half goals: "DI1+" → "H1:1+", "DII2+" → "H2:2+", "GI1+" → "H1:1+", "GII2+" → "H2:2+"
-    # (team is already encoded in bt119 vs bt120, so strip team prefix)
-    m = re.match(r'^[DG]II(\d[\d\-+]*)$', p)
-    if m:
-        return 'H2:' + m.group(1)
-    m = re.match(r'^[DG]I(\d[\d\-+]*)$', p)
-    if m:
-        return 'H1:' + m.group(1)
-
-    # Half goals: "I1+" → "H1:1+", "II2+" → "H2:2+"
-    m = re.match(r'^II(\d[\d\-+]*)$', p)
-    if m:
-        return 'H2:' + m.group(1)
-    m = re.match(r'^I(\d[\d\-+]*)$', p)
-    if m:
-        return 'H1:' + m.group(1)
-
-    # Half under: "I0-1" → "H1:0-1", "II0-2" → "H2:0-2"
-    m = re.match(r'^II(\d+-\d+)$', p)
-    if m:
-        return 'H2:' + m.group(1)
-    m = re.match(r'^I(\d+-\d+)$', p)
-    if m:
-        return 'H1:' + m.group(1)
-
-    # Team totals in combo:
-    # For bt119/bt120: team prefix is redundant (already in bt), strip it
-    # For other bts: "D2+" → "H2+", "G2+" → "A2+"
-    m = re.match(r'^D(\d[\d\-+]*)$', p)
+    m = _PART_RE.match(p)
     if m:
-        if bt in (119, 120):
-            return m.group(1)  # Strip team prefix: "D2+" → "2+"
-        return 'H' + m.group(1)
-    m = re.match(r'^G(\d[\d\-+]*)$', p)
-    if m:
-        if bt in (119, 120):
-            return m.group(1)  # Strip team prefix: "G2+" → "2+"
-        return 'A' + m.group(1)
+        tag = m.lastgroup
+        return _PART_REWRITES[tag](m.group(tag), bt)
 
     return p
 
 
+@lru_cache(maxsize=8192)
+@_interned
 def _normalize_htft_selection(name: str) -> str:
     """Normalize HT/FT selection: dash → slash.
 
@@ -629,32 +711,24 @@ def _normalize_htft_selection(name: str) -> str:
 
 
 def _normalize_or_part(p: str, bt: int) -> str:
-    """Normalize a single part of an OR selection."""
-    p = p.strip()
+    """Normalize a single (already stripped) part of an OR selection."""
     if not p:
         return p
 
     # For bt124: convert HT/FT dashes to slashes (e.g. "1-1" → "1/1")
     if bt == 124:
-        p = re.sub(r'([12X])-([12X])', r'\1/\2', p)
+        p = _HTFT_DASH_RE.sub(r'\1/\2', p)
 
     # Half BTTS: "IGG" → "GG_H1", "IIGG" → "GG_H2", "ING" → "NG_H1", "IING" → "NG_H2"
-    if p in ('IGG', 'I GG'):
-        return 'GG_H1'
-    if p in ('IIGG', 'II GG'):
-        return 'GG_H2'
-    if p in ('ING', 'I NG'):
-        return 'NG_H1'
-    if p in ('IING', 'II NG'):
-        return 'NG_H2'
+    r = _HALF_BTTS.get(p)
+    if r is not None:
+        return r
 
     # Half goals: "I2+" → "H1:2+", "II2+" → "H2:2+"
-    m = re.match(r'^II(\d[\d\-+]*)$', p)
-    if m:
-        return 'H2:' + m.group(1)
-    m = re.match(r'^I(\d[\d\-+]*)$', p)
-    if m:
-        return 'H1:' + m.group(1)
+    m = _PART_RE.match(p)
+    if m and m.lastgroup in ('h1_goals', 'h2_goals'):
+        tag = m.lastgroup
+        return _PART_REWRITES[tag](m.group(tag), bt)
 
     # GG/NG with goal count: "GG4+" → "GG&4+" or leave as-is
     # These are already in acceptable format
@@ -662,6 +736,7 @@ def _normalize_or_part(p: str, bt: int) -> str:
     return p
 
 
+@_interned
 def _normalize_tennis_games(name: str) -> Optional[str]:
     """Normalize tennis set games range selection.
 
@@ -669,14 +744,19 @@ def _normalize_tennis_games(name: str) -> Optional[str]:
     "I 6-7" → "6-7", "I 8+" → "8+", "I Par" → None
     """
     n = name.strip()
-    # Strip set prefix
-    n = re.sub(r'^I{1,2}\s+', '', n)
+    # Strip set prefix ("I " / "II ", whitespace required after the numeral)
+    if n.startswith('II') and n[2:3].isspace():
+        n = n[2:].lstrip()
+    elif n.startswith('I') and n[1:2].isspace():
+        n = n[1:].lstrip()
     # Skip odd/even outcomes (not game ranges)
     if n.lower() in ('par', 'nepar'):
         return None
     return n
 
 
+@lru_cache(maxsize=8192)
+@_interned
 def _normalize_ou_combo(name: str) -> str:
     """Normalize O/U combo selection.
 
@@ -694,21 +774,36 @@ def _normalize_ou_combo(name: str) -> str:
     ou_part = parts[1].strip()
 
     # Normalize result part: strip period prefix (I, II) and spaces
-    result_part = re.sub(r'^I{1,2}\s*', '', result_part)
+    if result_part.startswith('II'):
+        result_part = result_part[2:].lstrip()
+    elif result_part.startswith('I'):
+        result_part = result_part[1:].lstrip()
 
     # Normalize O/U part: strip period prefix, then Manje → U, Više → O
-    ou_part_clean = re.sub(r'^I{1,2}\s*', '', ou_part)
-    ou_lower = ou_part_clean.lower()
-    if 'manje' in ou_lower:
-        ou_norm = 'U'
-    elif 'više' in ou_lower or 'vise' in ou_lower:
-        ou_norm = 'O'
+    if ou_part.startswith('II'):
+        ou_part_clean = ou_part[2:].lstrip()
+    elif ou_part.startswith('I'):
+        ou_part_clean = ou_part[1:].lstrip()
     else:
-        ou_norm = ou_part_clean  # fallback
+        ou_part_clean = ou_part
+    ou_norm = _OU_WORD.get(ou_part_clean)
+    if ou_norm is not None:
+        return f"{result_part}&{ou_norm}"
+
+    ou_norm = ou_part_clean  # fallback
+    # Only lowercase when an m/v is present, otherwise neither keyword can match
+    if any(c in ou_part_clean for c in ('m', 'M', 'v', 'V')):
+        ou_lower = ou_part_clean.lower()
+        if 'manje' in ou_lower:
+            ou_norm = 'U'
+        elif 'više' in ou_lower or 'vise' in ou_lower:
+            ou_norm = 'O'
 
     return f"{result_part}&{ou_norm}"
 
 
+@lru_cache(maxsize=8192)
+@_interned
 def _normalize_or_selection(name: str, bt: int = 0) -> str:
     """Normalize OR combination selections.
 
@@ -724,7 +819,7 @@ def _normalize_or_selection(name: str, bt: int = 0) -> str:
         n = n[2:]
 
     # v → |
-    parts = re.split(r'\s*v\s*', n, flags=re.IGNORECASE)
+    parts = _OR_SPLIT_RE.split(n)
     normalized = [_normalize_or_part(p.strip(), bt) for p in parts]
 
     if len(normalized) >= 2:
@@ -733,6 +828,60 @@ def _normalize_or_selection(name: str, bt: int = 0) -> str:
     return normalized[0] if normalized else n
 
 
+# bt → normalizer for generic selection markets, all called as
+# (name, bt, market_id); unlisted bts use _normalize_selection
+_SELECTION_NORMALIZERS: Dict[int, Callable[[str, int, int], Optional[str]]] = {
+    # Exact/range goal counts
+    **dict.fromkeys(
+        (25, 26, 27, 28, 29, 30, 31, 32, 33, 34),
+        lambda name, bt, market_id: _normalize_goal_selection(name, bt),
+    ),
+    # Result/goal/half combos and first goal + result
+    **dict.fromkeys(
+        (35, 36, 38, 39, 40, 41, 42, 43, 44, 45, 119, 120),
+        _normalize_combo_selection,
+    ),
+    # Tennis set games range: strip set prefix, odd/even → None (skipped)
+    66: lambda name, bt, market_id: _normalize_tennis_games(name),
+    67: lambda name, bt, market_id: _normalize_tennis_games(name),
+    # Multi correct score: use name as-is (group labels)
+    118: lambda name, bt, market_id: name,
+}
+
+# Team goal markets whose '&' outcomes are team+half combos (bt119/bt120)
+_GOAL_COMBO_BT = {27: 119, 28: 120}
+
+
+def _position(outcome: Dict) -> Any:
+    """Sort key for outcomes: their position, missing/None as 0."""
+    return outcome.get('position') or 0
+
+
+def _by_pos(outcomes: List[Dict], n: int) -> Optional[List[Dict]]:
+    """Return the n lowest-position outcomes in order, or None if fewer than n.
+
+    Outcomes normally carry distinct 0-based positions and are dropped straight
+    into slots in one pass. Anything else (gaps, duplicates, non-int positions)
+    falls back to a stable sort, so the result always equals sorted(...)[:n].
+    """
+    slots = [None] * n
+    for o in outcomes:
+        p = o.get('position') or 0
+        if type(p) is not int:
+            break
+        if p < n:
+            if p < 0 or slots[p] is not None:
+                break
+            slots[p] = o
+    else:
+        if None not in slots:
+            return slots
+
+    if len(outcomes) < n:
+        return None
+    return sorted(outcomes, key=_position)[:n]
+
+
 # ============================================================================
 # SCRAPER
 # ============================================================================
@@ -743,6 +892,33 @@ class BalkanBetScraper(BaseScraper):
 
     def __init__(self):
         super().__init__(bookmaker_id=12, bookmaker_name="balkanbet")
+        # (time bucket, formatted 'filter[from]') for the overview request
+        self._overview_from_cache: Tuple[int, str] = (-1, '')
+
+        # parser_type → handler, all called as (outcomes, special_values, bt,
+        # market_id, match); adapters drop the arguments a parser doesn't take
+        self._market_parsers: Dict[str, Callable[..., None]] = {
+            '3way': lambda oc, sv, bt, mid, m: self._parse_3way(oc, bt, m),
+            '2way': lambda oc, sv, bt, mid, m: self._parse_2way(oc, bt, m),
+            '3way_fg': lambda oc, sv, bt, mid, m: self._parse_3way_fg(oc, bt, m),
+            'ah': lambda oc, sv, bt, mid, m: self._parse_asian_handicap(oc, sv, bt, m),
+            'eh': lambda oc, sv, bt, mid, m: self._parse_european_handicap(oc, sv, bt, m),
+            'ou': lambda oc, sv, bt, mid, m: self._parse_over_under(oc, sv, bt, m),
+            'btts': lambda oc, sv, bt, mid, m: self._parse_btts(oc, m),
+            'sel_ou': lambda oc, sv, bt, mid, m: self._parse_sel_ou(oc, sv, bt, m),
+            'sel_score': lambda oc, sv, bt, mid, m: self._parse_correct_score(oc, bt, m),
+            'sel_htft': lambda oc, sv, bt, mid, m: self._parse_htft_selection(oc, bt, mid, m),
+            'sel_btts': lambda oc, sv, bt, mid, m: self._parse_btts_selection(oc, bt, mid, m),
+            'sel_or': lambda oc, sv, bt, mid, m: self._parse_or_selection(oc, bt, mid, m),
+            'sel': lambda oc, sv, bt, mid, m: self._parse_selection(oc, bt, mid, m),
+        }
+        # (sport_id, marketId) → (bt, handler), resolved once so each market
+        # costs a single lookup on the hot path
+        self._market_handlers: Dict[Tuple[int, int], Tuple[int, Callable[..., None]]] = {
+            key: (bt, self._market_parsers[parser_type])
+            for key, (bt, parser_type) in MARKET_LOOKUP.items()
+            if parser_type in self._market_parsers
+        }
 
     def get_base_url(self) -> str:
         return BASE_URL
@@ -757,6 +933,16 @@ class BalkanBetScraper(BaseScraper):
             'Accept-Language': 'sr-Latn,sr;q=0.9,en;q=0.8',
         }
 
+    def get_connector(self) -> aiohttp.TCPConnector:
+        """Size the keep-alive pool to the detail fan-out."""
+        return aiohttp.TCPConnector(
+            limit=MAX_CONCURRENT_DETAIL,
+            limit_per_host=MAX_CONCURRENT_DETAIL,
+            ttl_dns_cache=600,
+            keepalive_timeout=60,
+            enable_cleanup_closed=True,
+        )
+
     async def scrape_sport(self, sport_id: int) -> List[ScrapedMatch]:
         """Scrape all matches for a sport from BalkanBet."""
         bb_sport_id = INTERNAL_TO_BB.get(sport_id)
@@ -764,26 +950,34 @@ class BalkanBetScraper(BaseScraper):
             logger.warning(f"[balkanbet] Unsupported sport_id: {sport_id}")
             return []
 
-        # Step 1: Get all match IDs from overview API
-        match_ids = await self._fetch_match_ids(bb_sport_id)
+        # Step 1: Get all match IDs from overview API. The bucketed start
+        # filter can list events that kicked off up to OVERVIEW_FROM_BUCKET
+        # seconds ago; those are dropped below so only pre-match odds remain.
+        now = datetime.now(timezone.utc)
+        match_ids = await self._fetch_match_ids(bb_sport_id, self._overview_from())
         if not match_ids:
             logger.warning(f"[balkanbet] No matches found for sport {sport_id}")
             return []
 
         logger.info(f"[balkanbet] Found {len(match_ids)} matches for sport {sport_id}")
 
-        # Step 2: Fetch detail for each match concurrently
+        # Step 2: Fetch detail for each match concurrently, collecting each
+        # parsed match as soon as its request completes
         sem = asyncio.Semaphore(MAX_CONCURRENT_DETAIL)
-        tasks = [self._fetch_match_detail(mid, sem) for mid in match_ids]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        matches = []
         errors = 0
-        for result in results:
-            if isinstance(result, Exception):
+
+        async def fetch(mid: int) -> Optional[ScrapedMatch]:
+            nonlocal errors
+            try:
+                return await self._fetch_match_detail(mid, sem)
+            except Exception:
                 errors += 1
-                continue
-            if result is not None:
+                return None
+
+        matches = []
+        for next_done in asyncio.as_completed([fetch(mid) for mid in match_ids]):
+            result = await next_done
+            if result is not None and result.start_time >= now:
                 matches.append(result)
 
         if errors:
@@ -798,23 +992,28 @@ class BalkanBetScraper(BaseScraper):
 
         return matches
 
-    async def _fetch_match_ids(self, bb_sport_id: int) -> List[int]:
-        """Fetch all match IDs from the overview API."""
-        now = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%S')
+    def _overview_from(self) -> str:
+        """Return the overview 'filter[from]' value for the current time bucket.
+
+        The timestamp is floored to OVERVIEW_FROM_BUCKET seconds, so the
+        overview requests for one sport in consecutive cycles within a window
+        share the same URL (filter[sportId] still differs between sports).
+        Flooring widens the window: the overview may include events that
+        started up to OVERVIEW_FROM_BUCKET seconds ago.
+        """
+        bucket = int(time.time()) // OVERVIEW_FROM_BUCKET * OVERVIEW_FROM_BUCKET
+        if self._overview_from_cache[0] != bucket:
+            from_str = datetime.fromtimestamp(bucket, tz=timezone.utc).strftime('%Y-%m-%dT%H:%M:%S')
+            self._overview_from_cache = (bucket, from_str)
+        return self._overview_from_cache[1]
+
+    async def _fetch_match_ids(self, bb_sport_id: int, from_str: str) -> List[int]:
+        """Fetch all match IDs starting from from_str (UTC) from the overview API."""
         url = f"{BASE_URL}/events"
-        params = {
-            'deliveryPlatformId': '3',
-            'dataFormat': '{"default":"object","events":"array","outcomes":"array"}',
-            'language': '{"default":"sr-Latn","events":"sr-Latn","sport":"sr-Latn","category":"sr-Latn","tournament":"sr-Latn","team":"sr-Latn","market":"sr-Latn"}',
-            'timezone': 'Europe/Budapest',
-            'company': '{}',
-            'companyUuid': COMPANY_UUID,
-            'filter[sportId]': str(bb_sport_id),
-            'filter[from]': now,
-            'sort': 'categoryPosition,categoryName,tournamentPosition,tournamentName,startsAt',
-            'offerTemplate': 'WEB_OVERVIEW',
-            'shortProps': '1',
-        }
+        params = _OVERVIEW_BASE_QUERY + (
+            ('filter[sportId]', str(bb_sport_id)),
+            ('filter[from]', from_str),
+        )
 
         data = await self.fetch_json(url, params=params)
         if not data or 'data' not in data:
@@ -830,13 +1029,7 @@ class BalkanBetScraper(BaseScraper):
         """Fetch and parse full odds for a single match."""
         async with sem:
             url = f"{BASE_URL}/events/{match_id}"
-            params = {
-                'companyUuid': COMPANY_UUID,
-                'id': str(match_id),
-                'language': '{"default":"sr-Latn","events":"sr-Latn","sport":"sr-Latn","category":"sr-Latn","tournament":"sr-Latn","team":"sr-Latn","market":"sr-Latn"}',
-                'timezone': 'Europe/Budapest',
-                'dataFormat': '{"default":"array","markets":"array","events":"array"}',
-            }
+            params = _DETAIL_BASE_QUERY + (('id', str(match_id)),)
 
             data = await self.fetch_json(url, params=params)
             if not data or 'data' not in data:
@@ -869,10 +1062,11 @@ class BalkanBetScraper(BaseScraper):
                 league_name=None,
             )
 
-            # Parse all markets
-            markets = data.get('markets', [])
-            for market in markets:
-                if not market.get('active'):
+            # Parse mapped, active markets; unmapped ones are dropped on the id
+            # alone so their outcomes are never touched
+            parsed_ids = PARSED_MARKET_IDS.get(sport_id, frozenset())
+            for market in data.get('markets', []):
+                if market.get('marketId') not in parsed_ids or not market.get('active'):
                     continue
                 self._parse_market(market, match, sport_id)
 
@@ -886,8 +1080,8 @@ class BalkanBetScraper(BaseScraper):
         self, outcomes: List[Dict], bt: int, match: ScrapedMatch
     ) -> None:
         """Parse 3-way market (1X2, DC, H1 1X2, etc.) by position."""
-        sorted_oc = sorted(outcomes, key=lambda x: x.get('position') or 0)
-        if len(sorted_oc) < 3:
+        sorted_oc = _by_pos(outcomes, 3)
+        if sorted_oc is None:
             return
 
         odd1 = sorted_oc[0].get('odd', 0)
@@ -901,8 +1095,8 @@ class BalkanBetScraper(BaseScraper):
         self, outcomes: List[Dict], bt: int, match: ScrapedMatch
     ) -> None:
         """Parse 2-way market (BTTS, O/E, DNB, etc.) by position."""
-        sorted_oc = sorted(outcomes, key=lambda x: x.get('position') or 0)
-        if len(sorted_oc) < 2:
+        sorted_oc = _by_pos(outcomes, 2)
+        if sorted_oc is None:
             return
 
         odd1 = sorted_oc[0].get('odd', 0)
@@ -922,19 +1116,16 @@ class BalkanBetScraper(BaseScraper):
         For last_goal bt89 which is outcomes=2 in config but actually has 3:
           odd1=home, odd2=away (skip Niko/none)
         """
-        # Sort by position to get consistent ordering
-        sorted_oc = sorted(outcomes, key=lambda x: x.get('position') or 0)
-
         if bt == 89:
             # Fix 2.3: Last goal market (market 662) has 3 outcomes:
             # odd1=team1 scores last, odd2=nobody scores last (Niko), odd3=team2 scores last
             # Parse all 3 outcomes so cross-bookmaker arbitrage works correctly.
             home_odd = none_odd = away_odd = None
-            for o in sorted_oc:
-                name = o.get('name', '').strip()
+            for o in sorted(outcomes, key=_position):
                 odd = o.get('odd', 0)
                 if odd <= 0:
                     continue
+                name = o.get('name', '').strip()
                 shortcut = o.get('shortcut', '')
                 if 'Niko' in name or 'niko' in name.lower():
                     none_odd = odd  # Fix 2.3: nobody scores last → oddX position
@@ -952,7 +1143,8 @@ class BalkanBetScraper(BaseScraper):
                     match.add_odds(bet_type_id=bt, odd1=home_odd, odd2=away_odd)
         else:
             # 3-way: home / none / away
-            if len(sorted_oc) >= 3:
+            sorted_oc = _by_pos(outcomes, 3)
+            if sorted_oc is not None:
                 odd1 = sorted_oc[0].get('odd', 0)
                 odd2 = sorted_oc[1].get('odd', 0)
                 odd3 = sorted_oc[2].get('odd', 0)
@@ -979,8 +1171,8 @@ class BalkanBetScraper(BaseScraper):
         except (ValueError, TypeError):
             return
 
-        sorted_oc = sorted(outcomes, key=lambda x: x.get('position') or 0)
-        if len(sorted_oc) < 2:
+        sorted_oc = _by_pos(outcomes, 2)
+        if sorted_oc is None:
             return
 
         odd1 = sorted_oc[0].get('odd', 0)  # Home
@@ -1011,8 +1203,8 @@ class BalkanBetScraper(BaseScraper):
         except (ValueError, IndexError):
             return
 
-        sorted_oc = sorted(outcomes, key=lambda x: x.get('position') or 0)
-        if len(sorted_oc) < 3:
+        sorted_oc = _by_pos(outcomes, 3)
+        if sorted_oc is None:
             return
 
         odd1 = sorted_oc[0].get('odd', 0)  # Home
@@ -1034,6 +1226,7 @@ class BalkanBetScraper(BaseScraper):
         BalkanBet uses shortcut "00", "10", "21" but name has the colon format.
         We parse from shortcut: "XY" → "X:Y"
         """
+        rows = []
         for o in outcomes:
             odd = o.get('odd', 0)
             if odd <= 0:
@@ -1046,13 +1239,20 @@ class BalkanBetScraper(BaseScraper):
             else:
                 # Fallback: try to extract from name
                 name = o.get('name', '')
-                m = re.match(r'(\d+):(\d+)', name)
-                if m:
-                    selection = f"{m.group(1)}:{m.group(2)}"
+                home, sep, away = name.partition(':')
+                if sep and home.isdecimal() and away.isdecimal():
+                    selection = name
                 else:
-                    continue
+                    # Trailing text after the score ("2:1 "), keep digits only
+                    m = _CORRECT_SCORE_RE.match(name)
+                    if m:
+                        selection = f"{m.group(1)}:{m.group(2)}"
+                    else:
+                        continue
 
-            match.add_odds(bet_type_id=bt, odd1=odd, selection=selection)
+            rows.append((bt, odd, None, None, 0.0, selection))
+
+        match.add_odds_bulk(rows)
 
     def _parse_htft_selection(
         self, outcomes: List[Dict], bt: int, market_id: int,
@@ -1064,6 +1264,7 @@ class BalkanBetScraper(BaseScraper):
         For bt44 (HT/FT + total): "1-1&2+" → "1/1&2+"
         For bt45 (HT/FT + BTTS): "1-1&GG" → "1/1&GG"
         """
+        rows = []
         for o in outcomes:
             odd = o.get('odd', 0)
             if odd <= 0:
@@ -1083,7 +1284,9 @@ class BalkanBetScraper(BaseScraper):
                 selection = name.replace('-', '/')
 
             if selection:
-                match.add_odds(bet_type_id=bt, odd1=odd, selection=selection)
+                rows.append((bt, odd, None, None, 0.0, selection))
+
+        match.add_odds_bulk(rows)
 
     def _parse_btts_selection(
         self, outcomes: List[Dict], bt: int, market_id: int,
@@ -1091,6 +1294,7 @@ class BalkanBetScraper(BaseScraper):
     ) -> None:
         """Parse BTTS combo selection markets (2237, 2240, 2243 etc.).
         Note: market 425 is handled separately by _handle_btts_market."""
+        rows = []
         for o in outcomes:
             odd = o.get('odd', 0)
             if odd <= 0:
@@ -1102,13 +1306,16 @@ class BalkanBetScraper(BaseScraper):
 
             selection = _normalize_btts_outcome(name)
             if selection:
-                match.add_odds(bet_type_id=bt, odd1=odd, selection=selection)
+                rows.append((bt, odd, None, None, 0.0, selection))
+
+        match.add_odds_bulk(rows)
 
     def _parse_or_selection(
         self, outcomes: List[Dict], bt: int, market_id: int,
         match: ScrapedMatch
     ) -> None:
         """Parse OR combination selection markets."""
+        rows = []
         for o in outcomes:
             odd = o.get('odd', 0)
             if odd <= 0:
@@ -1126,7 +1333,9 @@ class BalkanBetScraper(BaseScraper):
                     selection = "h1ft:" + selection  # Fix 2.7: H1 or FT result prefix
                 elif bt == 114 and market_id == 458:
                     selection = "rott:" + selection  # Fix 2.7: Result or total prefix
-                match.add_odds(bet_type_id=bt, odd1=odd, selection=selection)
+                rows.append((bt, odd, None, None, 0.0, selection))
+
+        match.add_odds_bulk(rows)
 
     def _parse_over_under(
         self, outcomes: List[Dict], special_values: List,
@@ -1152,10 +1361,18 @@ class BalkanBetScraper(BaseScraper):
             odd = o.get('odd', 0)
             if odd <= 0:
                 continue
-            name = o.get('name', '').lower()
-            if 'više' in name or 'vise' in name or 'vi\u0161' in name:
+            name = o.get('name', '')
+            side = _OU_WORD.get(name)
+            if side is None:
+                # Unusual spelling: fall back to a case-insensitive substring scan
+                name = name.lower()
+                if 'viš' in name or 'vise' in name:
+                    side = 'O'
+                elif 'manje' in name:
+                    side = 'U'
+            if side == 'O':
                 over_odd = odd
-            elif 'manje' in name:
+            elif side == 'U':
                 under_odd = odd
 
         if over_odd and under_odd:
@@ -1177,9 +1394,15 @@ class BalkanBetScraper(BaseScraper):
             if odd <= 0:
                 continue
             name = o.get('name', '').strip()
-            if 'Da' in name or name == 'GG':
+            is_yes = _BTTS_YES_NO.get(name)
+            if is_yes is None:
+                if 'Da' in name:
+                    is_yes = True
+                elif 'Ne' in name:
+                    is_yes = False
+            if is_yes:
                 gg_odd = odd
-            elif 'Ne' in name or name == 'NG':
+            elif is_yes is False:
                 ng_odd = odd
 
         if gg_odd and ng_odd:
@@ -1201,6 +1424,7 @@ class BalkanBetScraper(BaseScraper):
         except (ValueError, TypeError):
             return
 
+        rows = []
         for o in outcomes:
             odd = o.get('odd', 0)
             if odd <= 0:
@@ -1210,13 +1434,20 @@ class BalkanBetScraper(BaseScraper):
                 continue
             selection = _normalize_ou_combo(name)
             if selection:
-                match.add_odds(bet_type_id=bt, odd1=odd, selection=selection, margin=margin)
+                rows.append((bt, odd, None, None, margin, selection))
+
+        match.add_odds_bulk(rows)
 
     def _parse_selection(
         self, outcomes: List[Dict], bt: int, market_id: int,
         match: ScrapedMatch
     ) -> None:
         """Parse generic selection-based markets."""
+        # Normalizer is fixed by bet type, so resolve it once per market
+        normalize = _SELECTION_NORMALIZERS.get(bt, _normalize_selection)
+        combo_bt = _GOAL_COMBO_BT.get(bt)
+
+        rows = []
         for o in outcomes:
             odd = o.get('odd', 0)
             if odd <= 0:
@@ -1226,42 +1457,35 @@ class BalkanBetScraper(BaseScraper):
             if not name:
                 continue
 
-            # Use appropriate normalizer based on bet type
-            actual_bt = bt
-
-            # Tennis set games range: strip set prefix, skip odd/even
-            if bt in (66, 67):
-                selection = _normalize_tennis_games(name)
-                if not selection:
-                    continue
             # Route combo outcomes from bt27/bt28 to bt119/bt120
-            elif bt in (27, 28) and '&' in name:
-                actual_bt = 119 if bt == 27 else 120
-                selection = _normalize_combo_selection(name, actual_bt, market_id)
-            elif bt in (25, 26, 27, 28, 29, 30, 31, 32, 33, 34):
-                selection = _normalize_goal_selection(name, bt)
-            elif bt in (35, 38, 39, 40, 41, 42, 43, 44, 45, 119, 120):
-                selection = _normalize_combo_selection(name, bt, market_id)
-            elif bt == 36:
-                selection = _normalize_combo_selection(name, bt, market_id)
-            elif bt == 118:
-                # Multi correct score: use name as-is (group labels)
-                selection = name
+            if combo_bt is not None and '&' in name:
+                actual_bt = combo_bt
+                selection = _normalize_combo_selection(name, combo_bt, market_id)
             else:
-                selection = _normalize_selection(name, bt, market_id)
+                actual_bt = bt
+                selection = normalize(name, bt, market_id)
 
             if selection:
-                match.add_odds(bet_type_id=actual_bt, odd1=odd, selection=selection)
+                rows.append((actual_bt, odd, None, None, 0.0, selection))
+
+        match.add_odds_bulk(rows)
 
     def _handle_btts_market(
         self, outcomes: List[Dict], match: ScrapedMatch
     ) -> None:
         """Handle market 425 specially: extract bt8 (2-way BTTS) from GG/NG,
-        and all other outcomes as bt46 selections."""
+        and all other outcomes as bt46 selections.
+
+        Takes the raw outcome list and filters active/priced outcomes in the
+        same single pass that picks out GG/NG.
+        """
         gg_odd = None
         ng_odd = None
+        others = []
 
         for o in outcomes:
+            if not o.get('active'):
+                continue
             odd = o.get('odd', 0)
             if odd <= 0:
                 continue
@@ -1270,23 +1494,20 @@ class BalkanBetScraper(BaseScraper):
                 gg_odd = odd
             elif name == 'NG':
                 ng_odd = odd
+            else:
+                others.append((odd, name))
 
         # Add bt8 (BTTS yes/no) as 2-way
         if gg_odd and ng_odd:
             match.add_odds(bet_type_id=8, odd1=gg_odd, odd2=ng_odd)
 
         # Add all other outcomes as bt46 selections
-        for o in outcomes:
-            odd = o.get('odd', 0)
-            if odd <= 0:
-                continue
-            name = o.get('name', '').strip()
-            if name in ('GG', 'NG'):
-                continue  # Already handled as bt8
-
+        rows = []
+        for odd, name in others:
             selection = _normalize_btts_outcome(name)
             if selection:
-                match.add_odds(bet_type_id=46, odd1=odd, selection=selection)
+                rows.append((46, odd, None, None, 0.0, selection))
+        match.add_odds_bulk(rows)
 
     def _parse_market(
         self, market: Dict, match: ScrapedMatch, sport_id: int = 1
@@ -1296,55 +1517,18 @@ class BalkanBetScraper(BaseScraper):
 
         # Football-only: special handling for BTTS market 425
         if sport_id == 1 and market_id == 425:
-            outcomes = market.get('outcomes', [])
-            active_outcomes = [o for o in outcomes if o.get('active')]
-            if active_outcomes:
-                self._handle_btts_market(active_outcomes, match)
+            self._handle_btts_market(market.get('outcomes', []), match)
             return
 
-        # Select map based on sport
-        market_map = SPORT_MAPS.get(sport_id)
-        if not market_map:
+        handler = self._market_handlers.get((sport_id, market_id))
+        if handler is None:
             return
 
-        mapping = market_map.get(market_id)
-        if not mapping:
-            return
-
-        bt, parser_type = mapping
-        if bt is None or parser_type == 'skip':
-            return
+        bt, parse = handler
 
         outcomes = market.get('outcomes', [])
         active_outcomes = [o for o in outcomes if o.get('active')]
         if not active_outcomes:
             return
 
-        special_values = market.get('specialValues', [])
-
-        if parser_type == '3way':
-            self._parse_3way(active_outcomes, bt, match)
-        elif parser_type == '2way':
-            self._parse_2way(active_outcomes, bt, match)
-        elif parser_type == '3way_fg':
-            self._parse_3way_fg(active_outcomes, bt, match)
-        elif parser_type == 'ah':
-            self._parse_asian_handicap(active_outcomes, special_values, bt, match)
-        elif parser_type == 'eh':
-            self._parse_european_handicap(active_outcomes, special_values, bt, match)
-        elif parser_type == 'ou':
-            self._parse_over_under(active_outcomes, special_values, bt, match)
-        elif parser_type == 'btts':
-            self._parse_btts(active_outcomes, match)
-        elif parser_type == 'sel_ou':
-            self._parse_sel_ou(active_outcomes, special_values, bt, match)
-        elif parser_type == 'sel_score':
-            self._parse_correct_score(active_outcomes, bt, match)
-        elif parser_type == 'sel_htft':
-            self._parse_htft_selection(active_outcomes, bt, market_id, match)
-        elif parser_type == 'sel_btts':
-            self._parse_btts_selection(active_outcomes, bt, market_id, match)
-        elif parser_type == 'sel_or':
-            self._parse_or_selection(active_outcomes, bt, market_id, match)
-        elif parser_type == 'sel':
-            self._parse_selection(active_outcomes, bt, market_id, match)
+        parse(active_outcomes, market.get('specialValues', []), bt, market_id, match)
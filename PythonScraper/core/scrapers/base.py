@@ -6,19 +6,80 @@ All bookmaker scrapers inherit from this base class.
 
 import asyncio
 import logging
+import operator
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any, Iterable, Tuple
 import aiohttp
 from aiohttp import ClientTimeout, ClientSession
 
+# JSON decoder shared by the scrapers: orjson when installed, stdlib otherwise
+try:
+    import orjson
+    json_loads = orjson.loads
+    _JSONDecodeError = orjson.JSONDecodeError
+except ImportError:  # stdlib fallback when orjson is not installed
+    import json
+    json_loads = json.loads
+    _JSONDecodeError = json.JSONDecodeError
+
 from ..config import settings
 
 logger = logging.getLogger(__name__)
 
+# Retries for 429/5xx responses in fetch_json, with exponential back-off (seconds).
+# Only idempotent methods are retried: a POST answered with a 5xx may already
+# have been processed upstream.
+HTTP_RETRIES = 1
+_RETRY_METHODS = frozenset({'GET', 'HEAD'})
+HTTP_RETRY_BACKOFF = 0.5
+# Upper bound on a server-requested Retry-After wait (seconds)
+HTTP_RETRY_AFTER_MAX = 5.0
+
+# strptime formats accepted by BaseScraper.parse_timestamp
+_TIMESTAMP_FORMATS = (
+    '%Y-%m-%dT%H:%M:%S',
+    '%Y-%m-%dT%H:%M:%S.%f',
+    '%Y-%m-%d %H:%M:%S',
+    '%Y-%m-%d %H:%M',
+)
+
+# Separators tried by BaseScraper.parse_teams when the requested one is absent
+_FALLBACK_TEAM_SEPARATORS = (' vs ', ' v ', ' @ ', '-')
+
+
+def _is_iso_shaped(ts: str) -> bool:
+    """True if ts has the separator layout of one of _TIMESTAMP_FORMATS."""
+    n = len(ts)
+    if n == 16:
+        return ts[10] == ' ' and ts[13] == ':'
+    if n == 19:
+        return ts[10] in ('T', ' ') and ts[13] == ':' and ts[16] == ':'
+    if 21 <= n <= 26:  # %f takes 1-6 digits
+        return (ts[10] == 'T' and ts[13] == ':' and ts[16] == ':' and ts[19] == '.'
+                and ts[20:].isdigit())
+    return False
+
+
+def _retry_delay(retry_after: Optional[str], attempt: int) -> float:
+    """Back-off before retry number attempt + 1.
+
+    Honours a delta-seconds Retry-After header (capped); HTTP-date values and
+    missing headers fall back to exponential back-off.
+    """
+    if retry_after and retry_after.isdigit():
+        return min(float(retry_after), HTTP_RETRY_AFTER_MAX)
+    return HTTP_RETRY_BACKOFF * 2 ** attempt
+
+
+# Field order of ScrapedOdds.to_tuple(), read in C by a single attrgetter call
+_ODDS_TUPLE = operator.attrgetter(
+    'bet_type_id', 'margin', 'odd1', 'odd2', 'odd3', 'selection'
+)
 
-@dataclass
+
+@dataclass(slots=True)
 class ScrapedOdds:
     """Represents odds scraped from a bookmaker."""
     bet_type_id: int
@@ -29,10 +90,10 @@ class ScrapedOdds:
     selection: str = ''  # outcome identifier for multi-outcome markets
 
     def to_tuple(self) -> Tuple:
-        return (self.bet_type_id, self.margin, self.odd1, self.odd2, self.odd3, self.selection)
+        return _ODDS_TUPLE(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class ScrapedMatch:
     """Represents a match with odds scraped from a bookmaker."""
     team1: str
@@ -48,14 +109,15 @@ class ScrapedMatch:
                  odd3: Optional[float] = None, margin: float = 0.0,
                  selection: str = '') -> None:
         """Add odds to this match."""
-        self.odds.append(ScrapedOdds(
-            bet_type_id=bet_type_id,
-            odd1=odd1,
-            odd2=odd2,
-            odd3=odd3,
-            margin=margin,
-            selection=selection
-        ))
+        # Positional construction: skips keyword binding on the hottest path
+        self.odds.append(ScrapedOdds(bet_type_id, odd1, odd2, odd3, margin, selection))
+
+    def add_odds_bulk(self, rows: Iterable[Tuple]) -> None:
+        """Add many odds at once from ScrapedOdds field tuples.
+
+        Each row is (bet_type_id, odd1, odd2, odd3, margin, selection).
+        """
+        self.odds.extend([ScrapedOdds(*row) for row in rows])
 
 
 class BaseScraper(ABC):
@@ -75,7 +137,8 @@ class BaseScraper(ABC):
         self.bookmaker_id = bookmaker_id
         self.bookmaker_name = bookmaker_name
         self._session: Optional[ClientSession] = None
-        self._semaphore = asyncio.Semaphore(settings.max_concurrent_requests)
+        self._headers: Optional[Dict[str, str]] = None
+        self._semaphore = asyncio.BoundedSemaphore(settings.max_concurrent_requests)
         self._request_count = 0
         self._error_count = 0
         self._last_scrape: Optional[datetime] = None
@@ -86,11 +149,27 @@ class BaseScraper(ABC):
         if self._session is None or self._session.closed:
             timeout = ClientTimeout(total=settings.request_timeout_seconds)
             self._session = ClientSession(
+                connector=self.get_connector(),
                 timeout=timeout,
                 headers=self.get_headers()
             )
         return self._session
 
+    def get_connector(self) -> aiohttp.TCPConnector:
+        """Build the session's connection pool. Override to resize it.
+
+        Each scraper talks to a single bookmaker host, so the per-host cap
+        matches the request semaphore and DNS answers are cached for the
+        life of the session.
+        """
+        return aiohttp.TCPConnector(
+            limit=settings.max_concurrent_requests * 2,
+            limit_per_host=settings.max_concurrent_requests,
+            ttl_dns_cache=600,
+            keepalive_timeout=60,
+            enable_cleanup_closed=True,
+        )
+
     async def reset_session(self) -> None:
         """Reset the session for error recovery (close and null so it's lazily recreated)."""
         if self._session and not self._session.closed:
@@ -111,6 +190,21 @@ class BaseScraper(ABC):
             'Accept-Language': 'en-US,en;q=0.9,sr;q=0.8',
         }
 
+    @property
+    def request_headers(self) -> Dict[str, str]:
+        """Headers sent with every fetch_json request, built once from get_headers().
+
+        Treat the returned dict as read-only. Call invalidate_headers() when
+        state that get_headers() depends on changes (e.g. an auth token).
+        """
+        if self._headers is None:
+            self._headers = self.get_headers()
+        return self._headers
+
+    def invalidate_headers(self) -> None:
+        """Rebuild request_headers from get_headers() on the next request."""
+        self._headers = None
+
     @abstractmethod
     def get_base_url(self) -> str:
         """Return the API base URL for this bookmaker."""
@@ -141,25 +235,31 @@ class BaseScraper(ABC):
 
         logger.info(f"[{self.bookmaker_name}] Scraping {len(sports)} sports")
 
-        tasks = [self.scrape_sport(sport_id) for sport_id in sports]
+        # Named tasks so profilers and asyncio debug output attribute work per sport
+        tasks = [
+            asyncio.create_task(
+                self.scrape_sport(sport_id), name=f"{self.bookmaker_name}-{sport_id}"
+            )
+            for sport_id in sports
+        ]
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
+        debug = logger.isEnabledFor(logging.DEBUG)
         for sport_id, result in zip(sports, results):
             if isinstance(result, Exception):
                 logger.error(f"[{self.bookmaker_name}] Error scraping sport {sport_id}: {result}")
                 self._error_count += 1
             else:
                 all_matches.extend(result)
-                if result:
+                if debug and result:
                     total_odds = sum(len(m.odds) for m in result)
-                    avg = total_odds / len(result)
                     logger.debug(
-                        f"[{self.bookmaker_name}] Sport {sport_id}: "
-                        f"{len(result)} matches, {total_odds} odds "
-                        f"({avg:.0f} avg/match)"
+                        "[%s] Sport %s: %d matches, %d odds (%.0f avg/match)",
+                        self.bookmaker_name, sport_id, len(result), total_odds,
+                        total_odds / len(result)
                     )
-                else:
-                    logger.debug(f"[{self.bookmaker_name}] Sport {sport_id}: 0 matches")
+                elif debug:
+                    logger.debug("[%s] Sport %s: 0 matches", self.bookmaker_name, sport_id)
 
         self._last_scrape = datetime.now(timezone.utc)
         total_odds = sum(len(m.odds) for m in all_matches)
@@ -174,7 +274,7 @@ class BaseScraper(ABC):
         self,
         url: str,
         method: str = 'GET',
-        params: Optional[Dict] = None,
+        params: Optional[Any] = None,
         json_data: Optional[Dict] = None,
         headers: Optional[Dict] = None
     ) -> Optional[Any]:
@@ -184,68 +284,80 @@ class BaseScraper(ABC):
         Args:
             url: The URL to fetch
             method: HTTP method (GET, POST)
-            params: Query parameters
+            params: Query parameters (dict or sequence of key/value pairs)
             json_data: JSON body for POST requests
             headers: Additional headers
 
         Returns:
             Parsed JSON or None on error
         """
-        async with self._semaphore:
-            self._request_count += 1
-
-            try:
-                request_headers = self.get_headers()
-                if headers:
-                    request_headers.update(headers)
-
-                if method.upper() == 'GET':
-                    async with self.session.get(
-                        url, params=params, headers=request_headers
+        try:
+            request_headers = self.request_headers
+            if headers:
+                request_headers = {**request_headers, **headers}
+
+            method = method.upper()
+            for attempt in range(HTTP_RETRIES + 1):
+                # A request slot is held only while the request is in flight,
+                # never across the back-off sleep below
+                async with self._semaphore:
+                    self._request_count += 1
+                    async with self.session.request(
+                        method, url, params=params,
+                        json=json_data if method == 'POST' else None,
+                        headers=request_headers
                     ) as response:
-                        if response.status == 200:
-                            return await response.json()
-                        else:
-                            logger.warning(
-                                f"[{self.bookmaker_name}] HTTP {response.status} for {url}"
-                            )
-                            return None
-                else:  # POST
-                    async with self.session.post(
-                        url, params=params, json=json_data, headers=request_headers
-                    ) as response:
-                        if response.status == 200:
-                            return await response.json()
-                        else:
-                            logger.warning(
-                                f"[{self.bookmaker_name}] HTTP {response.status} for {url}"
-                            )
-                            return None
-
-            except asyncio.TimeoutError:
-                logger.warning(f"[{self.bookmaker_name}] Timeout for {url}")
-                self._error_count += 1
-                return None
-            except aiohttp.ClientError as e:
-                logger.warning(f"[{self.bookmaker_name}] Client error for {url}: {e}")
-                self._error_count += 1
-                return None
-            except Exception as e:
-                logger.error(f"[{self.bookmaker_name}] Unexpected error for {url}: {e}")
-                self._error_count += 1
+                        status = response.status
+                        if status == 200:
+                            body = await response.read()
+                            # Empty body means no data, as with response.json()
+                            if not body.strip():
+                                return None
+                            return json_loads(body)
+                        # Return the connection to the pool before logging/backing off
+                        response.release()
+                        retry_after = response.headers.get('Retry-After')
+
+                if (attempt < HTTP_RETRIES and method in _RETRY_METHODS
+                        and (status == 429 or status >= 500)):
+                    delay = _retry_delay(retry_after, attempt)
+                    logger.debug(
+                        "[%s] HTTP %s for %s, retrying in %.1fs",
+                        self.bookmaker_name, status, url, delay
+                    )
+                    await asyncio.sleep(delay)
+                    continue
+
+                logger.warning("[%s] HTTP %s for %s", self.bookmaker_name, status, url)
                 return None
 
+        except asyncio.TimeoutError:
+            logger.warning("[%s] Timeout for %s", self.bookmaker_name, url)
+            self._error_count += 1
+            return None
+        except aiohttp.ClientError as e:
+            logger.warning("[%s] Client error for %s: %s", self.bookmaker_name, url, e)
+            self._error_count += 1
+            return None
+        except _JSONDecodeError as e:
+            logger.warning("[%s] Invalid JSON for %s: %s", self.bookmaker_name, url, e)
+            self._error_count += 1
+            return None
+        except Exception as e:
+            logger.error("[%s] Unexpected error for %s: %s", self.bookmaker_name, url, e)
+            self._error_count += 1
+            return None
+
     def parse_teams(self, match_name: str, separator: str = ' - ') -> Tuple[str, str]:
         """Parse team names from match name string."""
-        parts = match_name.split(separator, 1)
-        if len(parts) == 2:
-            return parts[0].strip(), parts[1].strip()
-        # Fallback: try other separators
-        for sep in [' vs ', ' v ', ' @ ', '-']:
-            if sep in match_name:
-                parts = match_name.split(sep, 1)
-                if len(parts) == 2:
-                    return parts[0].strip(), parts[1].strip()
+        home, found, away = match_name.partition(separator)
+        if found:
+            return home.strip(), away.strip()
+        # Fallback: try other separators, in priority order
+        for sep in _FALLBACK_TEAM_SEPARATORS:
+            home, found, away = match_name.partition(sep)
+            if found:
+                return home.strip(), away.strip()
         # Last resort: return as-is
         return match_name.strip(), ""
 
@@ -263,18 +375,19 @@ class BaseScraper(ABC):
         elif isinstance(timestamp, str):
             # Remove trailing 'Z' for UTC
             timestamp = timestamp.rstrip('Z')
-            # Try common formats
-            for fmt in [
-                '%Y-%m-%dT%H:%M:%S',
-                '%Y-%m-%dT%H:%M:%S.%f',
-                '%Y-%m-%d %H:%M:%S',
-                '%Y-%m-%d %H:%M',
-            ]:
+            # Fast path: shapes of _TIMESTAMP_FORMATS go through the C ISO parser
+            if _is_iso_shaped(timestamp):
                 try:
-                    result = datetime.strptime(timestamp, fmt)
-                    break
+                    result = datetime.fromisoformat(timestamp)
                 except ValueError:
-                    continue
+                    pass
+            if result is None:
+                for fmt in _TIMESTAMP_FORMATS:
+                    try:
+                        result = datetime.strptime(timestamp, fmt)
+                        break
+                    except ValueError:
+                        continue
 
         # Ensure result is timezone-aware (UTC)
         if result and result.tzinfo is None:
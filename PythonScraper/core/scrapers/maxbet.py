@@ -727,6 +727,53 @@ TABLE_TENNIS_2WAY = {
 }
 
 
+# ============================================================================
+# FLATTENED ROWS (what the parsers iterate per match)
+# ============================================================================
+
+def _flatten(mapping: Dict[int, Any]) -> Tuple[Tuple, ...]:
+    """Flatten a {bet_type_id: entries} table into (bet_type_id, *entry) rows.
+
+    Entries may be a single code tuple, a list of code tuples, or a
+    {code: selection} dict; table order is preserved.
+    """
+    rows: List[Tuple] = []
+    for bt, entries in mapping.items():
+        if isinstance(entries, tuple):
+            rows.append((bt, *entries))
+        elif isinstance(entries, dict):
+            rows.extend((bt, code, selection) for code, selection in entries.items())
+        else:
+            rows.extend((bt, *entry) for entry in entries)
+    return tuple(rows)
+
+
+_FOOTBALL_3WAY_ROWS = _flatten(FOOTBALL_3WAY)
+_FOOTBALL_2WAY_ROWS = _flatten(FOOTBALL_2WAY)
+_FOOTBALL_FIXED_TOTALS_ROWS = _flatten(FOOTBALL_FIXED_TOTALS)
+_FOOTBALL_PARAM_TOTALS_ROWS = _flatten(FOOTBALL_PARAM_TOTALS)
+_FOOTBALL_PARAM_HANDICAPS_3WAY_ROWS = _flatten(FOOTBALL_PARAM_HANDICAPS_3WAY)
+_FOOTBALL_PARAM_HANDICAPS_2WAY_ROWS = _flatten(FOOTBALL_PARAM_HANDICAPS_2WAY)
+_FOOTBALL_SELECTIONS_ROWS = _flatten(FOOTBALL_SELECTIONS)
+_BASKETBALL_2WAY_ROWS = _flatten(BASKETBALL_2WAY)
+_BASKETBALL_PARAM_HANDICAPS_ROWS = _flatten(BASKETBALL_PARAM_HANDICAPS)
+_BASKETBALL_PARAM_TOTALS_ROWS = _flatten(BASKETBALL_PARAM_TOTALS)
+_TENNIS_2WAY_ROWS = _flatten(TENNIS_2WAY)
+_TENNIS_SIMPLE_2WAY_ROWS = _flatten(TENNIS_SIMPLE_2WAY)
+_TENNIS_3WAY_ROWS = _flatten(TENNIS_3WAY)
+_TENNIS_PARAM_TOTALS_ROWS = _flatten(TENNIS_PARAM_TOTALS)
+_TENNIS_PARAM_HANDICAPS_ROWS = _flatten(TENNIS_PARAM_HANDICAPS)
+_TENNIS_SELECTIONS_ROWS = _flatten(TENNIS_SELECTIONS)
+_HOCKEY_3WAY_ROWS = _flatten(HOCKEY_3WAY)
+_HOCKEY_SIMPLE_3WAY_ROWS = _flatten(HOCKEY_SIMPLE_3WAY)
+_HOCKEY_PERIOD_3WAY_ROWS = _flatten(HOCKEY_PERIOD_3WAY)
+_HOCKEY_2WAY_ROWS = _flatten(HOCKEY_2WAY)
+_HOCKEY_PARAM_TOTALS_ROWS = _flatten(HOCKEY_PARAM_TOTALS)
+_HOCKEY_PARAM_HANDICAPS_ROWS = _flatten(HOCKEY_PARAM_HANDICAPS)
+_HOCKEY_SELECTIONS_ROWS = _flatten(HOCKEY_SELECTIONS)
+_TABLE_TENNIS_2WAY_ROWS = _flatten(TABLE_TENNIS_2WAY)
+
+
 class MaxbetScraper(BaseScraper):
     """
     Scraper for MaxBet Serbia.
@@ -737,6 +784,14 @@ class MaxbetScraper(BaseScraper):
 
     def __init__(self):
         super().__init__(bookmaker_id=3, bookmaker_name="Maxbet")
+        # sport_id -> parse method, resolved once instead of per match
+        self._odds_parsers = {
+            1: self.parse_football_odds,
+            2: self.parse_basketball_odds,
+            3: self.parse_tennis_odds,
+            4: self.parse_hockey_odds,
+            5: self.parse_table_tennis_odds,
+        }
 
     def get_base_url(self) -> str:
         return "https://www.maxbet.rs/restapi/offer/sr"
@@ -762,70 +817,64 @@ class MaxbetScraper(BaseScraper):
 
     @staticmethod
     def _parse_3way_markets(
-        odds: Dict, odds_list: List[ScrapedOdds], mapping: Dict[int, Tuple[str, str, str]]
+        odds: Dict, odds_list: List[ScrapedOdds], rows: Tuple[Tuple[int, str, str, str], ...]
     ) -> None:
-        """Parse simple 3-way markets from code mapping."""
-        for bt, (c1, c2, c3) in mapping.items():
+        """Parse simple 3-way markets from (bt, code1, code2, code3) rows."""
+        # ScrapedOdds is built positionally in these helpers: keyword
+        # binding costs about a third of each construction.
+        # Field order: (bet_type_id, odd1, odd2, odd3, margin, selection)
+        for bt, c1, c2, c3 in rows:
             o1, o2, o3 = odds.get(c1), odds.get(c2), odds.get(c3)
             if o1 and o2 and o3:
-                odds_list.append(ScrapedOdds(
-                    bet_type_id=bt, odd1=float(o1), odd2=float(o2), odd3=float(o3)
-                ))
+                odds_list.append(ScrapedOdds(bt, float(o1), float(o2), float(o3)))
 
     @staticmethod
     def _parse_2way_markets(
-        odds: Dict, odds_list: List[ScrapedOdds], mapping: Dict[int, Tuple[str, str]]
+        odds: Dict, odds_list: List[ScrapedOdds], rows: Tuple[Tuple[int, str, str], ...]
     ) -> None:
-        """Parse simple 2-way markets from code mapping."""
-        for bt, (c1, c2) in mapping.items():
+        """Parse simple 2-way markets from (bt, code1, code2) rows."""
+        for bt, c1, c2 in rows:
             o1, o2 = odds.get(c1), odds.get(c2)
             if o1 and o2:
-                odds_list.append(ScrapedOdds(
-                    bet_type_id=bt, odd1=float(o1), odd2=float(o2)
-                ))
+                odds_list.append(ScrapedOdds(bt, float(o1), float(o2)))
 
     @staticmethod
     def _parse_fixed_totals(
         odds: Dict, odds_list: List[ScrapedOdds],
-        mapping: Dict[int, List[Tuple[float, str, str]]]
+        rows: Tuple[Tuple[int, float, str, str], ...]
     ) -> None:
         """Parse fixed-margin O/U pairs (margin baked into code)."""
-        for bt, pairs in mapping.items():
-            for margin, under_code, over_code in pairs:
-                under = odds.get(under_code)
-                over = odds.get(over_code)
-                if under and over:
-                    odds_list.append(ScrapedOdds(
-                        # Fix 2.4: Convention: odd1=Over, odd2=Under
-                        bet_type_id=bt, odd1=float(over), odd2=float(under), margin=margin
-                    ))
+        for bt, margin, under_code, over_code in rows:
+            under = odds.get(under_code)
+            over = odds.get(over_code)
+            if under and over:
+                # Fix 2.4: Convention: odd1=Over, odd2=Under
+                odds_list.append(ScrapedOdds(bt, float(over), float(under), None, margin))
 
     @staticmethod
     def _parse_param_totals(
         odds: Dict, params: Dict, odds_list: List[ScrapedOdds],
-        mapping: Dict[int, List[Tuple[str, str, str]]]
+        rows: Tuple[Tuple[int, str, str, str], ...]
     ) -> None:
         """Parse param-based O/U pairs (margin from match params)."""
-        for bt, entries in mapping.items():
-            for param_key, under_code, over_code in entries:
-                if under_code in odds and over_code in odds:
-                    margin_val = params.get(param_key)
-                    if margin_val is not None:
-                        try:
-                            odds_list.append(ScrapedOdds(
-                                bet_type_id=bt,
-                                # Fix 2.4: Convention: odd1=Over, odd2=Under
-                                odd1=float(odds[over_code]),
-                                odd2=float(odds[under_code]),
-                                margin=float(margin_val)
-                            ))
-                        except (ValueError, TypeError):
-                            continue
+        for bt, param_key, under_code, over_code in rows:
+            under = odds.get(under_code)
+            over = odds.get(over_code)
+            if under is not None and over is not None:
+                margin_val = params.get(param_key)
+                if margin_val is not None:
+                    try:
+                        # Fix 2.4: Convention: odd1=Over, odd2=Under
+                        odds_list.append(ScrapedOdds(
+                            bt, float(over), float(under), None, float(margin_val)
+                        ))
+                    except (ValueError, TypeError):
+                        continue
 
     @staticmethod
     def _parse_param_handicaps_3way(
         odds: Dict, params: Dict, odds_list: List[ScrapedOdds],
-        mapping: Dict[int, List[Tuple[str, str, str, str]]]
+        rows: Tuple[Tuple[int, str, str, str, str], ...]
     ) -> None:
         """Parse param-based 3-way handicap (margin from match params).
 
@@ -833,27 +882,24 @@ class MaxbetScraper(BaseScraper):
         advantage.  MaxBet API returns negative values when home team
         receives goals (opposite of Admiral/Merkur convention).
         """
-        for bt, entries in mapping.items():
-            for param_key, h_code, x_code, a_code in entries:
-                if h_code in odds and x_code in odds and a_code in odds:
-                    margin_val = params.get(param_key)
-                    if margin_val is not None:
-                        try:
-                            margin = float(margin_val)
-                            odds_list.append(ScrapedOdds(
-                                bet_type_id=bt,
-                                odd1=float(odds[h_code]),
-                                odd2=float(odds[x_code]),
-                                odd3=float(odds[a_code]),
-                                margin=-margin  # Flip sign: positive = home advantage
-                            ))
-                        except (ValueError, TypeError):
-                            continue
+        for bt, param_key, h_code, x_code, a_code in rows:
+            home, draw, away = odds.get(h_code), odds.get(x_code), odds.get(a_code)
+            if home is not None and draw is not None and away is not None:
+                margin_val = params.get(param_key)
+                if margin_val is not None:
+                    try:
+                        margin = float(margin_val)
+                        # Flip sign: positive = home advantage
+                        odds_list.append(ScrapedOdds(
+                            bt, float(home), float(draw), float(away), -margin
+                        ))
+                    except (ValueError, TypeError):
+                        continue
 
     @staticmethod
     def _parse_param_handicaps_2way(
         odds: Dict, params: Dict, odds_list: List[ScrapedOdds],
-        mapping: Dict[int, List[Tuple[str, str, str]]]
+        rows: Tuple[Tuple[int, str, str, str], ...]
     ) -> None:
         """Parse param-based 2-way handicap (margin from match params).
 
@@ -861,38 +907,33 @@ class MaxbetScraper(BaseScraper):
         advantage.  API gives negative value for home handicap; we flip
         to match the cross-bookmaker convention.
         """
-        for bt, entries in mapping.items():
-            for param_key, h_code, a_code in entries:
-                if h_code in odds and a_code in odds:
-                    margin_val = params.get(param_key)
-                    if margin_val is not None:
-                        try:
-                            margin = float(margin_val)
-                            odds_list.append(ScrapedOdds(
-                                bet_type_id=bt,
-                                odd1=float(odds[h_code]),
-                                odd2=float(odds[a_code]),
-                                margin=-margin  # Flip sign: positive = home advantage
-                            ))
-                        except (ValueError, TypeError):
-                            continue
+        for bt, param_key, h_code, a_code in rows:
+            home, away = odds.get(h_code), odds.get(a_code)
+            if home is not None and away is not None:
+                margin_val = params.get(param_key)
+                if margin_val is not None:
+                    try:
+                        margin = float(margin_val)
+                        # Flip sign: positive = home advantage
+                        odds_list.append(ScrapedOdds(
+                            bt, float(home), float(away), None, -margin
+                        ))
+                    except (ValueError, TypeError):
+                        continue
 
     @staticmethod
     def _parse_selections(
         odds: Dict, odds_list: List[ScrapedOdds],
-        mapping: Dict[int, Dict[str, str]]
+        rows: Tuple[Tuple[int, str, str], ...]
     ) -> None:
         """Parse selection-based markets (each code = one selection)."""
-        for bt, code_map in mapping.items():
-            for code, selection in code_map.items():
-                value = odds.get(code)
-                if value:
-                    try:
-                        odds_list.append(ScrapedOdds(
-                            bet_type_id=bt, odd1=float(value), selection=selection
-                        ))
-                    except (ValueError, TypeError):
-                        continue
+        for bt, code, selection in rows:
+            value = odds.get(code)
+            if value:
+                try:
+                    odds_list.append(ScrapedOdds(bt, float(value), None, None, 0.0, selection))
+                except (ValueError, TypeError):
+                    continue
 
     # ========================================================================
     # Sport-specific parse methods
@@ -905,25 +946,25 @@ class MaxbetScraper(BaseScraper):
         params = match_data.get("params", {})
 
         # 3-way markets (1X2, DC, first goal, etc.)
-        self._parse_3way_markets(odds, odds_list, FOOTBALL_3WAY)
+        self._parse_3way_markets(odds, odds_list, _FOOTBALL_3WAY_ROWS)
 
         # 2-way markets (BTTS, odd/even, DNB, etc.)
-        self._parse_2way_markets(odds, odds_list, FOOTBALL_2WAY)
+        self._parse_2way_markets(odds, odds_list, _FOOTBALL_2WAY_ROWS)
 
         # Fixed-margin totals (FT, H1, H2)
-        self._parse_fixed_totals(odds, odds_list, FOOTBALL_FIXED_TOTALS)
+        self._parse_fixed_totals(odds, odds_list, _FOOTBALL_FIXED_TOTALS_ROWS)
 
         # Param-based team totals O/U
-        self._parse_param_totals(odds, params, odds_list, FOOTBALL_PARAM_TOTALS)
+        self._parse_param_totals(odds, params, odds_list, _FOOTBALL_PARAM_TOTALS_ROWS)
 
         # Param-based 3-way handicaps
-        self._parse_param_handicaps_3way(odds, params, odds_list, FOOTBALL_PARAM_HANDICAPS_3WAY)
+        self._parse_param_handicaps_3way(odds, params, odds_list, _FOOTBALL_PARAM_HANDICAPS_3WAY_ROWS)
 
         # Param-based 2-way H1 handicap
-        self._parse_param_handicaps_2way(odds, params, odds_list, FOOTBALL_PARAM_HANDICAPS_2WAY)
+        self._parse_param_handicaps_2way(odds, params, odds_list, _FOOTBALL_PARAM_HANDICAPS_2WAY_ROWS)
 
         # Selection-based markets (correct score, HT/FT, ranges, etc.)
-        self._parse_selections(odds, odds_list, FOOTBALL_SELECTIONS)
+        self._parse_selections(odds, odds_list, _FOOTBALL_SELECTIONS_ROWS)
 
         return odds_list
 
@@ -934,13 +975,13 @@ class MaxbetScraper(BaseScraper):
         params = match_data.get("params", {})
 
         # Winner (2-way, incl. overtime)
-        self._parse_2way_markets(odds, odds_list, BASKETBALL_2WAY)
+        self._parse_2way_markets(odds, odds_list, _BASKETBALL_2WAY_ROWS)
 
         # Param-based handicaps (2-way, multiple lines)
-        self._parse_param_handicaps_2way(odds, params, odds_list, BASKETBALL_PARAM_HANDICAPS)
+        self._parse_param_handicaps_2way(odds, params, odds_list, _BASKETBALL_PARAM_HANDICAPS_ROWS)
 
         # Param-based totals (total points, H1, team totals)
-        self._parse_param_totals(odds, params, odds_list, BASKETBALL_PARAM_TOTALS)
+        self._parse_param_totals(odds, params, odds_list, _BASKETBALL_PARAM_TOTALS_ROWS)
 
         return odds_list
 
@@ -951,22 +992,22 @@ class MaxbetScraper(BaseScraper):
         params = match_data.get("params", {})
 
         # Match winner, first set winner
-        self._parse_2way_markets(odds, odds_list, TENNIS_2WAY)
+        self._parse_2way_markets(odds, odds_list, _TENNIS_2WAY_ROWS)
 
         # Simple 2-way (tiebreak, odd/even)
-        self._parse_2way_markets(odds, odds_list, TENNIS_SIMPLE_2WAY)
+        self._parse_2way_markets(odds, odds_list, _TENNIS_SIMPLE_2WAY_ROWS)
 
         # 3-way (set with more games)
-        self._parse_3way_markets(odds, odds_list, TENNIS_3WAY)
+        self._parse_3way_markets(odds, odds_list, _TENNIS_3WAY_ROWS)
 
         # Param-based total games
-        self._parse_param_totals(odds, params, odds_list, TENNIS_PARAM_TOTALS)
+        self._parse_param_totals(odds, params, odds_list, _TENNIS_PARAM_TOTALS_ROWS)
 
         # Param-based handicaps (set handicap, game handicap S1)
-        self._parse_param_handicaps_2way(odds, params, odds_list, TENNIS_PARAM_HANDICAPS)
+        self._parse_param_handicaps_2way(odds, params, odds_list, _TENNIS_PARAM_HANDICAPS_ROWS)
 
         # Selection-based (exact sets, first set+match combo, games range)
-        self._parse_selections(odds, odds_list, TENNIS_SELECTIONS)
+        self._parse_selections(odds, odds_list, _TENNIS_SELECTIONS_ROWS)
 
         return odds_list
 
@@ -977,25 +1018,25 @@ class MaxbetScraper(BaseScraper):
         params = match_data.get("params", {})
 
         # 1X2 Full Time
-        self._parse_3way_markets(odds, odds_list, HOCKEY_3WAY)
+        self._parse_3way_markets(odds, odds_list, _HOCKEY_3WAY_ROWS)
 
         # Double chance
-        self._parse_3way_markets(odds, odds_list, HOCKEY_SIMPLE_3WAY)
+        self._parse_3way_markets(odds, odds_list, _HOCKEY_SIMPLE_3WAY_ROWS)
 
         # Period 1X2 (periods mapped to H1/H2 bet types)
-        self._parse_3way_markets(odds, odds_list, HOCKEY_PERIOD_3WAY)
+        self._parse_3way_markets(odds, odds_list, _HOCKEY_PERIOD_3WAY_ROWS)
 
         # 2-way markets (DNB, BTTS, odd/even)
-        self._parse_2way_markets(odds, odds_list, HOCKEY_2WAY)
+        self._parse_2way_markets(odds, odds_list, _HOCKEY_2WAY_ROWS)
 
         # Param-based totals (FT, period, team)
-        self._parse_param_totals(odds, params, odds_list, HOCKEY_PARAM_TOTALS)
+        self._parse_param_totals(odds, params, odds_list, _HOCKEY_PARAM_TOTALS_ROWS)
 
         # Param-based handicap (2-way)
-        self._parse_param_handicaps_2way(odds, params, odds_list, HOCKEY_PARAM_HANDICAPS)
+        self._parse_param_handicaps_2way(odds, params, odds_list, _HOCKEY_PARAM_HANDICAPS_ROWS)
 
         # Selection-based markets
-        self._parse_selections(odds, odds_list, HOCKEY_SELECTIONS)
+        self._parse_selections(odds, odds_list, _HOCKEY_SELECTIONS_ROWS)
 
         return odds_list
 
@@ -1005,23 +1046,16 @@ class MaxbetScraper(BaseScraper):
         odds = match_data.get("odds", {})
 
         # Winner only
-        self._parse_2way_markets(odds, odds_list, TABLE_TENNIS_2WAY)
+        self._parse_2way_markets(odds, odds_list, _TABLE_TENNIS_2WAY_ROWS)
 
         return odds_list
 
     def parse_odds(self, match_data: Dict, sport_id: int) -> List[ScrapedOdds]:
         """Parse odds based on sport type."""
-        if sport_id == 1:
-            return self.parse_football_odds(match_data)
-        elif sport_id == 2:
-            return self.parse_basketball_odds(match_data)
-        elif sport_id == 3:
-            return self.parse_tennis_odds(match_data)
-        elif sport_id == 4:
-            return self.parse_hockey_odds(match_data)
-        elif sport_id == 5:
-            return self.parse_table_tennis_odds(match_data)
-        return []
+        parser = self._odds_parsers.get(sport_id)
+        if parser is None:
+            return []
+        return parser(match_data)
 
     # ========================================================================
     # Network methods (unchanged)
@@ -1080,60 +1114,70 @@ class MaxbetScraper(BaseScraper):
 
         logger.debug(f"[Maxbet] Found {len(leagues)} leagues for sport {sport_id}")
 
-        # Fetch all league matches concurrently
-        league_tasks = [
-            self.fetch_league_matches(sport_id, lid)
-            for lid in leagues.values()
-        ]
-        league_results = await asyncio.gather(*league_tasks, return_exceptions=True)
+        # Fetch all league matches concurrently; a failed league yields no matches
+        async def fetch_league(lid) -> List[Dict]:
+            try:
+                return await self.fetch_league_matches(sport_id, lid)
+            except Exception:
+                return []
+
+        league_results = await asyncio.gather(
+            *[fetch_league(lid) for lid in leagues.values()]
+        )
 
         # Collect match IDs
         match_ids = []
         for result in league_results:
-            if isinstance(result, Exception):
-                continue
             for match in result:
                 league_name = match.get("leagueName", "")
                 if "Bonus Tip" not in league_name and "Max Bonus" not in league_name:
                     match_ids.append(match.get("id"))
 
-        # Fetch match details concurrently
-        detail_tasks = [
-            self.fetch_match_details(mid)
-            for mid in match_ids
-        ]
-        details = await asyncio.gather(*detail_tasks, return_exceptions=True)
-
-        for detail in details:
-            if isinstance(detail, Exception) or not detail:
-                continue
-
+        # Fetch match details concurrently, parsing each one as soon as its
+        # request completes so parsing overlaps the remaining network waits
+        async def fetch(mid) -> Optional[ScrapedMatch]:
             try:
-                team1 = detail.get("home", "")
-                team2 = detail.get("away", "")
-                if not team1 or not team2:
-                    continue
-
-                kick_off = detail.get("kickOffTime")
-                start_time = self.parse_timestamp(kick_off)
-                if not start_time:
-                    continue
-
-                scraped = ScrapedMatch(
-                    team1=team1,
-                    team2=team2,
-                    sport_id=sport_id,
-                    start_time=start_time,
-                    league_name=detail.get("leagueName"),
-                    external_id=str(detail.get("id")),
-                )
-
-                scraped.odds = self.parse_odds(detail, sport_id)
-
-                if scraped.odds:
-                    matches.append(scraped)
-
-            except Exception as e:
-                logger.warning(f"[Maxbet] Error processing match: {e}")
+                detail = await self.fetch_match_details(mid)
+            except Exception:
+                return None
+            if not detail:
+                return None
+            return self._parse_match_detail(detail, sport_id)
+
+        for next_done in asyncio.as_completed([fetch(mid) for mid in match_ids]):
+            result = await next_done
+            if result is not None:
+                matches.append(result)
 
         return matches
+
+    def _parse_match_detail(self, detail: Dict, sport_id: int) -> Optional[ScrapedMatch]:
+        """Parse match detail API response into ScrapedMatch."""
+        try:
+            team1 = detail.get("home", "")
+            team2 = detail.get("away", "")
+            if not team1 or not team2:
+                return None
+
+            kick_off = detail.get("kickOffTime")
+            start_time = self.parse_timestamp(kick_off)
+            if not start_time:
+                return None
+
+            odds = self.parse_odds(detail, sport_id)
+            if not odds:
+                return None
+
+            return ScrapedMatch(
+                team1=team1,
+                team2=team2,
+                sport_id=sport_id,
+                start_time=start_time,
+                odds=odds,
+                league_name=detail.get("leagueName"),
+                external_id=str(detail.get("id")),
+            )
+
+        except Exception as e:
+            logger.warning(f"[Maxbet] Error processing match: {e}")
+            return None
@@ -116,6 +116,7 @@ class MeridianScraper(BaseScraper):
         """Ensure we have a valid auth token."""
         if not self._auth_token:
             self._auth_token = await self.fetch_auth_token()
+            self.invalidate_headers()  # pick up the Authorization header
         return self._auth_token is not None
 
     async def fetch_events(self, sport_id: int, page: int = 0) -> Optional[Dict]:
@@ -14,7 +14,7 @@ from typing import Optional, List, Dict, Any, Tuple
 
 import aiohttp
 
-from .base import BaseScraper, ScrapedMatch, ScrapedOdds
+from .base import BaseScraper, ScrapedMatch, ScrapedOdds, json_loads
 
 logger = logging.getLogger(__name__)
 
@@ -72,7 +72,7 @@ class MozzartScraper(BaseScraper):
         try:
             async with self.session.post(url, json=payload) as response:
                 if response.status == 200:
-                    return await response.json(content_type=None)
+                    return await response.json(loads=json_loads, content_type=None)
                 else:
                     logger.warning(f"[Mozzart] HTTP {response.status} for {url}")
                     return None
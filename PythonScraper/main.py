@@ -77,6 +77,21 @@ def setup_logging(debug: bool = False):
     logging.getLogger('websockets').setLevel(logging.WARNING)
 
 
+def install_event_loop_policy():
+    """Run asyncio on uvloop when it is installed (stdlib loop otherwise).
+
+    uvloop is declared in requirements.txt for non-Windows platforms (there
+    is no Windows build). uvicorn already picks uvloop for the API server;
+    this covers the scraper-only and single-bookmaker modes that start via
+    asyncio.run().
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
 def parse_args():
     """Parse command line arguments."""
     parser = argparse.ArgumentParser(
@@ -448,6 +463,7 @@ def main():
         settings.log_level = 'DEBUG'
 
     setup_logging(debug=args.debug)
+    install_event_loop_policy()
 
     logger = logging.getLogger(__name__)
 
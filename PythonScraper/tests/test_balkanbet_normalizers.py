@@ -0,0 +1,133 @@
+"""
+Table-driven tests for the BalkanBet selection and combo normalizers.
+
+Run from PythonScraper/:
+    python -m pytest tests
+"""
+
+import sys
+from datetime import datetime, timezone
+
+import pytest
+
+from core.scrapers.balkanbet import (
+    BalkanBetScraper,
+    _normalize_combo_selection,
+    _normalize_goal_selection,
+    _normalize_selection,
+)
+from core.scrapers.base import ScrapedMatch
+
+
+# (name, bt, expected)
+SELECTION_CASES = [
+    # HT/FT markets: dash → slash
+    ('1-1', 24, '1/1'),
+    ('X-2', 37, 'X/2'),
+    # Exact goal markets: standalone digit → T-prefix
+    ('3', 26, 'T3'),
+    ('0', 25, 'T0'),
+    (' 1 ', 26, 'T1'),
+    # Other markets pass through
+    ('3', 8, '3'),
+    ('2+', 25, '2+'),
+]
+
+# (name, bt, expected)
+COMBO_CASES = [
+    # Result / DC + total
+    ('1&2+', 38, '1&2+'),
+    ('1X&3+', 41, '1X&3+'),
+    ('D2+&G1+', 38, 'H2+&A1+'),
+    # Half goals and NE(...) groups
+    ('I1+&II1+', 35, 'H1:1+&H2:1+'),
+    ('NE(I1+&II1+)', 35, '!H1:1+&H2:1+'),
+    # Half prefix: "I 1" → "1_H1"
+    ('I 1 &1X', 39, '1_H1&1X'),
+    ('I X &12', 39, 'X_H1&12'),
+    ('1X&I1+', 43, '1X&H1:1+'),
+    # Half comparison
+    ('1& I >', 40, '1&H1>H2'),
+    ('1X& II >', 42, '1X&H1<H2'),
+    ('I = II&1', 40, 'H1=H2&1'),
+    # HT/FT + goals
+    ('1-1&2+', 44, '1/1&2+'),
+    ('X-1&II2+', 44, 'X/1&H2:2+'),
+    # bt119/bt120: plain totals get FT: when mixed with half parts
+    ('I1+&2+', 119, 'H1:1+&FT:2+'),
+    ('II0-1&3+', 120, 'H2:0-1&FT:3+'),
+    ('DI1+&GII2+', 119, 'H1:1+&H2:2+'),
+    # OR separator
+    ('I 1 v 1', 39, '1_H1|1'),
+    ('1 v 3+', 38, '1|3+'),
+    # First goal: team is the first character after "PDG" / "PDG "
+    ('PDG1 & 1', 36, 'H_first&1'),
+    ('PDG 2&X', 36, 'A_first&X'),
+    ('PDG Niko&X', 36, 'none&X'),
+    # Unrecognised PDG tails are left as is, not guessed from later digits
+    ('PDG X1&1', 36, 'PDG X1&1'),
+    ('(PDG XVD0-1)', 36, 'PDG XVD0-1'),
+    # Non-breaking space counts as whitespace
+    ('I\xa01&1X', 39, '1_H1&1X'),
+    ('I\xa012&G2+', 38, '12_H1&A2+'),
+]
+
+# (name, bt, expected)
+GOAL_CASES = [
+    ('1 gol', 26, 'T1'),
+    ('2 gol.', 26, 'T2'),
+    ('3\xa0gol', 26, 'T3'),
+    ('D1g.', 27, 'T1'),
+    ('DI 2 gol', 31, 'T2'),
+    ('D0', 27, 'T0'),
+    ('G2+', 28, '2+'),
+    ('I 1+', 29, '1+'),
+    ('GII 2+', 34, '2+'),
+    ('0-2', 25, '0-2'),
+    ('NE 0-1', 25, '!0-1'),
+]
+
+
+@pytest.mark.parametrize('name,bt,expected', SELECTION_CASES)
+def test_normalize_selection(name, bt, expected):
+    assert _normalize_selection(name, bt, 0) == expected
+
+
+@pytest.mark.parametrize('name,bt,expected', COMBO_CASES)
+def test_normalize_combo_selection(name, bt, expected):
+    assert _normalize_combo_selection(name, bt, 0) == expected
+
+
+@pytest.mark.parametrize('name,bt,expected', GOAL_CASES)
+def test_normalize_goal_selection(name, bt, expected):
+    assert _normalize_goal_selection(name, bt) == expected
+
+
+def test_short_results_are_interned():
+    result = _normalize_combo_selection('I1+&II1+', 35, 0)
+    assert result is sys.intern('H1:1+&H2:1+')
+
+
+# (bt, outcome names, expected (bet_type_id, selection) rows)
+DISPATCH_CASES = [
+    (26, ['3', '1 gol'], [(26, 'T3'), (26, 'T1')]),
+    (36, ['PDG1 & 1', 'PDG Niko&X'], [(36, 'H_first&1'), (36, 'none&X')]),
+    (44, ['1-1&2+'], [(44, '1/1&2+')]),
+    # Team goal markets route '&' outcomes to the team+half combo bts
+    (27, ['D2+', 'DI1+&2+'], [(27, '2+'), (119, 'H1:1+&FT:2+')]),
+    (28, ['G0', 'GII0-1&3+'], [(28, 'T0'), (120, 'H2:0-1&FT:3+')]),
+    # Unlisted bts fall back to _normalize_selection
+    (24, ['1-1', 'X-2'], [(24, '1/1'), (24, 'X/2')]),
+]
+
+
+@pytest.mark.parametrize('bt,names,expected', DISPATCH_CASES)
+def test_parse_selection_dispatch(bt, names, expected):
+    scraper = BalkanBetScraper()
+    match = ScrapedMatch(
+        team1='A', team2='B', sport_id=1,
+        start_time=datetime(2026, 1, 1, tzinfo=timezone.utc),
+    )
+    outcomes = [{'name': name, 'odd': 2.0} for name in names]
+    scraper._parse_selection(outcomes, bt, 0, match)
+    assert [(o.bet_type_id, o.selection) for o in match.odds] == expected
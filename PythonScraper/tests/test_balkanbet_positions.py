@@ -0,0 +1,63 @@
+"""
+Tests for BalkanBet's positional outcome picker, _by_pos.
+
+Its single-pass slot fill must always agree with the stable sort it replaced:
+sorted(outcomes, key=_position)[:n], or None when there are fewer than n.
+
+Run from PythonScraper/:
+    python -m pytest tests
+"""
+
+import pytest
+
+from core.scrapers.balkanbet import _by_pos, _position
+
+_MISSING = object()
+
+# (positions, n); _MISSING leaves the 'position' key out
+POSITION_CASES = [
+    ([0, 1, 2], 3),
+    ([2, 0, 1], 3),
+    ([1, 0], 2),
+    ([0, 1, 2, 3, 4], 3),
+    ([4, 3, 2, 1, 0], 2),
+    # 1-based feeds
+    ([1, 2, 3], 3),
+    ([3, 1, 2], 2),
+    # Gaps and duplicates
+    ([0, 2, 3], 3),
+    ([0, 0, 1], 3),
+    ([1, 1, 0], 2),
+    # None / missing positions sort as 0
+    ([None, 1, 2], 3),
+    ([None, None, 1], 3),
+    ([_MISSING, 1, 2], 3),
+    # Non-int and negative positions
+    ([1.0, 0, 2], 3),
+    ([True, 0, 2], 3),
+    ([-1, 0, 1], 3),
+    # Too few outcomes
+    ([0, 1], 3),
+    ([], 2),
+]
+
+
+def _outcomes(positions):
+    outcomes = []
+    for i, p in enumerate(positions):
+        o = {'name': str(i), 'odd': 1.5 + i}
+        if p is not _MISSING:
+            o['position'] = p
+        outcomes.append(o)
+    return outcomes
+
+
+@pytest.mark.parametrize('positions,n', POSITION_CASES)
+def test_by_pos_matches_stable_sort(positions, n):
+    outcomes = _outcomes(positions)
+    expected = sorted(outcomes, key=_position)[:n] if len(outcomes) >= n else None
+    result = _by_pos(outcomes, n)
+    if expected is None:
+        assert result is None
+    else:
+        assert [id(o) for o in result] == [id(o) for o in expected]
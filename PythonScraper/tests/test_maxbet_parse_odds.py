@@ -0,0 +1,107 @@
+"""
+Regression tests for MaxbetScraper.parse_odds on representative match details.
+
+The expected rows were produced by the parser as it stood before the
+flattened-row rewrite, so any change in output order or values shows up here.
+
+Run from PythonScraper/:
+    python -m pytest tests
+"""
+
+from core.scrapers.base import ScrapedOdds
+from core.scrapers.maxbet import MaxbetScraper
+
+
+FOOTBALL_DETAIL = {
+    'odds': {
+        # 1X2 and double chance
+        '1': 2.1, '2': 3.4, '3': '3.6',
+        '7': 1.3, '8': 1.4, '9': 0,
+        # BTTS, odd/even
+        '272': 1.8, '273': 1.95, '232': 1.9, '231': 1.9,
+        # Fixed totals 2.5 FT, 0.5 H1 (267 is also the H1 "T0" selection)
+        '22': 1.85, '24': 1.95, '267': 3.2, '207': 1.3,
+        # Param totals: team 1 O/U (under priced at 0), team 2 with bad param
+        '355': 0, '356': 1.7, '357': 1.9, '358': 1.8,
+        # 3-way handicap lines, H1 2-way handicap
+        '201': 1.6, '202': 3.9, '203': 4.2,
+        '421': 2.5, '422': 3.3, '423': 2.6,
+        '224': 1.9, '226': 1.9,
+        # Correct score, HT/FT
+        '52': 7.0, '67': 6.5, '10': 3.0,
+        # Unmapped code
+        '99999': 5.0,
+    },
+    'params': {
+        'homeOverUnder': 1.5,
+        'awayOverUnder': 'x',
+        'hd2': -1,
+        'handicap2': '1',
+        'hdp': -0.5,
+    },
+}
+
+BASKETBALL_DETAIL = {
+    'odds': {
+        '50291': 1.5, '50293': 2.6,
+        '50458': 1.9, '50459': 1.9,
+        '50432': 1.7, '50433': 2.1,
+        '50460': 1.85, '50461': 1.95,
+        '50444': 1.9, '50445': 1.9,
+        '50446': 1.88, '50447': 1.92,
+        '50462': 1.8, '50463': 2.0,
+    },
+    'params': {
+        'handicapOvertime': -5.5,
+        'handicapOvertime2': '-7.5',
+        'handicapFirstHalf': 3,
+        'overUnderOvertime': 165.5,
+        'overUnderFirstHalf': '82.5',
+    },
+}
+
+
+# ScrapedOdds(bet_type_id, odd1, odd2, odd3, margin, selection)
+FOOTBALL_EXPECTED = [
+    ScrapedOdds(2, 2.1, 3.4, 3.6, 0.0, ''),
+    ScrapedOdds(8, 1.8, 1.95, None, 0.0, ''),
+    ScrapedOdds(15, 1.9, 1.9, None, 0.0, ''),
+    # Totals: odd1=Over, odd2=Under
+    ScrapedOdds(5, 1.95, 1.85, None, 2.5, ''),
+    ScrapedOdds(6, 1.3, 3.2, None, 0.5, ''),
+    # Param-based markets accept a 0 price; a non-numeric param drops the line
+    ScrapedOdds(48, 1.7, 0.0, None, 1.5, ''),
+    # Handicap sign is flipped: positive = home advantage
+    ScrapedOdds(9, 1.6, 3.9, 4.2, 1.0, ''),
+    ScrapedOdds(9, 2.5, 3.3, 2.6, -1.0, ''),
+    ScrapedOdds(50, 1.9, 1.9, None, 0.5, ''),
+    ScrapedOdds(23, 7.0, None, None, 0.0, '1:0'),
+    ScrapedOdds(23, 6.5, None, None, 0.0, '1:1'),
+    ScrapedOdds(24, 3.0, None, None, 0.0, '1/1'),
+    ScrapedOdds(29, 3.2, None, None, 0.0, 'T0'),
+]
+
+BASKETBALL_EXPECTED = [
+    ScrapedOdds(1, 1.5, 2.6, None, 0.0, ''),
+    ScrapedOdds(9, 1.9, 1.9, None, 5.5, ''),
+    ScrapedOdds(9, 1.7, 2.1, None, 7.5, ''),
+    ScrapedOdds(50, 1.85, 1.95, None, -3.0, ''),
+    ScrapedOdds(10, 1.9, 1.9, None, 165.5, ''),
+    ScrapedOdds(6, 1.92, 1.88, None, 82.5, ''),
+]
+
+
+def test_parse_football_odds():
+    assert MaxbetScraper().parse_odds(FOOTBALL_DETAIL, 1) == FOOTBALL_EXPECTED
+
+
+def test_parse_basketball_odds():
+    assert MaxbetScraper().parse_odds(BASKETBALL_DETAIL, 2) == BASKETBALL_EXPECTED
+
+
+def test_parse_odds_unknown_sport():
+    assert MaxbetScraper().parse_odds(FOOTBALL_DETAIL, 99) == []
+
+
+def test_parse_odds_empty_detail():
+    assert MaxbetScraper().parse_odds({}, 1) == []